@@ -16,6 +16,7 @@ import argparse
 import atexit
 import os
 import signal
+import socket
 import subprocess
 import sys
 import time
@@ -30,6 +31,7 @@ load_dotenv()
 # Cloud SQL configuration
 CLOUD_SQL_INSTANCE = "inspire-7-finep:southamerica-east1:destaquesgovbr-postgres"
 CLOUD_SQL_PROXY_PORT = 5434
+CLOUD_SQL_PROXY_START_TIMEOUT = 15  # seconds
 CLOUD_SQL_DATABASE = "govbrnews"
 CLOUD_SQL_USER = "govbrnews_app"
 SECRET_PASSWORD = "govbrnews-postgres-password"
@@ -147,7 +149,14 @@ def start_cloud_sql_proxy() -> subprocess.Popen:
         stderr=subprocess.DEVNULL
     )
 
-    time.sleep(3)  # Wait for proxy to start
+    # Wait until the proxy accepts connections (or exits) instead of a fixed sleep
+    deadline = time.monotonic() + CLOUD_SQL_PROXY_START_TIMEOUT
+    while time.monotonic() < deadline and proxy.poll() is None:
+        try:
+            with socket.create_connection(("127.0.0.1", CLOUD_SQL_PROXY_PORT), timeout=1):
+                break
+        except OSError:
+            time.sleep(0.2)
 
     if proxy.poll() is not None:
         raise RuntimeError("Cloud SQL Proxy failed to start")
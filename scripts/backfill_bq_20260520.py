@@ -25,17 +25,22 @@ DATASET = "dgb_gold"
 TABLE = "fato_noticias"
 
 
-def date_already_loaded(project_id: str, target_date: date) -> bool:
-    """Check if data for a given date already exists in BigQuery."""
+def loaded_dates(project_id: str, start: date, end: date) -> set[date]:
+    """Dates in [start, end) that already have rows in BigQuery (one query)."""
     from google.cloud import bigquery
 
     client = bigquery.Client(project=project_id)
     query = (
-        f"SELECT COUNT(*) as cnt FROM `{project_id}.{DATASET}.{TABLE}` "
-        f"WHERE DATE(published_at) = '{target_date}'"
+        f"SELECT DISTINCT DATE(published_at) AS day FROM `{project_id}.{DATASET}.{TABLE}` "
+        "WHERE published_at >= TIMESTAMP(@start) AND published_at < TIMESTAMP(@end)"
     )
-    result = list(client.query(query).result())[0]
-    return result.cnt > 0
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("start", "DATE", start),
+            bigquery.ScalarQueryParameter("end", "DATE", end),
+        ]
+    )
+    return {row.day for row in client.query(query, job_config=job_config).result()}
 
 
 def main():
@@ -63,10 +68,12 @@ def main():
     logger.info(f"Backfilling BigQuery fato_noticias: {start} to {end}")
     logger.info(f"Project: {project_id} | Bucket: {bucket}")
 
+    already_loaded = loaded_dates(project_id, start, end)
+
     while current < end:
         next_day = current + timedelta(days=1)
 
-        if date_already_loaded(project_id, current):
+        if current in already_loaded:
             logger.info(f"  {current}: already loaded, skipping")
             skipped += 1
             current = next_day
@@ -607,7 +607,8 @@ def _get_run_id() -> str | None:
     return os.getenv("GITHUB_RUN_ID")
 
 
-def main():
+def build_app():
+    """Build the typer CLI app (also used in-process by the integration tests)."""
     try:
         import typer
     except ImportError:
@@ -820,7 +821,11 @@ def main():
         finally:
             conn.close()
 
-    app()
+    return app
+
+
+def main():
+    build_app()()
 
 
 if __name__ == "__main__":
@@ -24,6 +24,9 @@ import time
 import unicodedata
 from datetime import date
 
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_DASHES_RE = re.compile(r"-+")
+
 
 # =============================================================================
 # ID Generation Functions (inline copy)
@@ -35,8 +38,8 @@ def slugify(text: str, max_length: int = 100) -> str:
     """Convert text to a URL-friendly slug."""
     text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
     text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
+    text = _NON_SLUG_RE.sub("-", text)
+    text = _DASHES_RE.sub("-", text).strip("-")
     if len(text) > max_length:
         truncated = text[:max_length]
         if "-" in truncated:
@@ -326,20 +329,16 @@ def rollback(conn, batch_size=1000):
     cursor = conn.cursor()
 
     try:
-        # 1. Check legacy_unique_id is populated
+        # 1-2. Check legacy_unique_id is populated and count rows to rollback (one scan)
         cursor.execute(
-            "SELECT COUNT(*) FROM news WHERE legacy_unique_id IS NULL"
+            "SELECT COUNT(*) FILTER (WHERE legacy_unique_id IS NULL), "
+            "COUNT(*) FILTER (WHERE unique_id != legacy_unique_id) FROM news"
         )
-        null_count = cursor.fetchone()[0]
+        null_count, to_rollback = cursor.fetchone()
         if null_count > 0:
             print(f"❌ {null_count} rows have NULL legacy_unique_id. Cannot rollback.")
             sys.exit(1)
 
-        # 2. Count rows to rollback
-        cursor.execute(
-            "SELECT COUNT(*) FROM news WHERE unique_id != legacy_unique_id"
-        )
-        to_rollback = cursor.fetchone()[0]
         if to_rollback == 0:
             print("   ℹ️  All records already have MD5 unique_ids. Nothing to rollback.")
             return
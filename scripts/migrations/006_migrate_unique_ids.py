@@ -243,16 +243,16 @@ def rollback(conn, dry_run: bool = False) -> dict:
     """Revert migration: restore MD5 unique_ids from legacy_unique_id."""
     cursor = conn.cursor()
 
-    # Check legacy_unique_id populated
-    cursor.execute("SELECT COUNT(*) FROM news WHERE legacy_unique_id IS NULL")
-    null_count = cursor.fetchone()[0]
+    # Check legacy_unique_id populated and count rows to rollback in one scan
+    cursor.execute(
+        "SELECT COUNT(*) FILTER (WHERE legacy_unique_id IS NULL), "
+        "COUNT(*) FILTER (WHERE unique_id != legacy_unique_id) FROM news"
+    )
+    null_count, to_rollback = cursor.fetchone()
     if null_count > 0:
         cursor.close()
         raise ValueError(f"{null_count} rows have NULL legacy_unique_id. Cannot rollback.")
 
-    cursor.execute("SELECT COUNT(*) FROM news WHERE unique_id != legacy_unique_id")
-    to_rollback = cursor.fetchone()[0]
-
     if to_rollback == 0:
         cursor.close()
         return {"rows_rolled_back": 0, "message": "All records already have MD5 unique_ids"}
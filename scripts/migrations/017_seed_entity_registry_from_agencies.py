@@ -294,10 +294,12 @@ def rollback(conn, dry_run: bool = False) -> dict:
     cursor = conn.cursor()
 
     if dry_run:
-        cursor.execute("SELECT COUNT(*) FROM entity_alias WHERE source = %s", (SOURCE,))
-        aliases_to_delete = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM entity_registry WHERE provenance = %s", (PROVENANCE,))
-        entities_to_delete = cursor.fetchone()[0]
+        cursor.execute(
+            "SELECT (SELECT COUNT(*) FROM entity_alias WHERE source = %s), "
+            "(SELECT COUNT(*) FROM entity_registry WHERE provenance = %s)",
+            (SOURCE, PROVENANCE),
+        )
+        aliases_to_delete, entities_to_delete = cursor.fetchone()
         cursor.close()
         return {
             "entities_to_delete": entities_to_delete,
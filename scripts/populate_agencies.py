@@ -12,15 +12,19 @@ Usage:
 """
 
 import argparse
+import io
 import os
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Any
 
 import psycopg2
-import yaml
 from loguru import logger
 
+from data_platform.utils.pg_copy import copy_text_row
+from data_platform.utils.yaml_utils import load_yaml
+
 
 def get_db_connection_string() -> str:
     """Get database connection string from environment or Secret Manager."""
@@ -89,7 +93,7 @@ def load_agencies_yaml(filepath: Path) -> Dict[str, Any]:
         sys.exit(1)
 
     with open(filepath, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
 
     if "sources" not in data:
         logger.error("Invalid agencies.yaml format: missing 'sources' key")
@@ -109,7 +113,7 @@ def populate_agencies(
 
     if dry_run:
         # Just display what would be inserted
-        for key, data in list(agencies.items())[:5]:
+        for key, data in islice(agencies.items(), 5):
             logger.info(f"Would insert: {key} -> {data['name']}")
         logger.info(f"... and {len(agencies) - 5} more")
         return
@@ -136,29 +140,32 @@ def populate_agencies(
         # Temporarily disable foreign key constraint for insertion
         cursor.execute("ALTER TABLE agencies DISABLE TRIGGER ALL")
 
-        # Insert agencies
-        insert_query = """
-            INSERT INTO agencies (key, name, type, parent_key, url)
-            VALUES (%s, %s, %s, %s, %s)
-        """
-
         # Sort agencies: those without parent first, then with parent
-        agencies_list = [(key, data) for key, data in agencies.items()]
-        agencies_list.sort(key=lambda x: (x[1].get("parent") is not None, x[0]))
+        agencies_list = sorted(
+            agencies.items(), key=lambda x: (x[1].get("parent") is not None, x[0])
+        )
 
-        inserted = 0
+        # Bulk load via COPY (one statement instead of one INSERT per agency)
+        buf = io.StringIO()
         for key, data in agencies_list:
-            cursor.execute(
-                insert_query,
-                (
-                    key,
-                    data["name"],
-                    data.get("type"),
-                    data.get("parent"),
-                    data.get("url"),
-                ),
+            buf.write(
+                copy_text_row(
+                    (
+                        key,
+                        data["name"],
+                        data.get("type"),
+                        data.get("parent"),
+                        data.get("url"),
+                    )
+                )
             )
-            inserted += 1
+        buf.seek(0)
+
+        cursor.copy_expert(
+            "COPY agencies (key, name, type, parent_key, url) FROM STDIN",
+            buf,
+        )
+        inserted = cursor.rowcount
 
         # Re-enable foreign key constraint
         cursor.execute("ALTER TABLE agencies ENABLE TRIGGER ALL")
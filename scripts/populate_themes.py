@@ -12,15 +12,18 @@ Usage:
 """
 
 import argparse
+import io
 import os
 import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 import psycopg2
-import yaml
 from loguru import logger
 
+from data_platform.utils.pg_copy import copy_text_row
+from data_platform.utils.yaml_utils import load_yaml
+
 
 def get_db_connection_string() -> str:
     """Get database connection string from environment or Secret Manager."""
@@ -89,7 +92,7 @@ def load_themes_yaml(filepath: Path) -> List[Dict[str, Any]]:
         sys.exit(1)
 
     with open(filepath, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
 
     if "themes" not in data:
         logger.error("Invalid themes file format: missing 'themes' key")
@@ -183,44 +186,47 @@ def populate_themes(
         cursor.execute("DELETE FROM themes")
         logger.info(f"Deleted {cursor.rowcount} existing records")
 
-        # Insert themes (important: insert parents before children)
-        insert_query = """
-            INSERT INTO themes (code, label, full_name, level, parent_code)
-            VALUES (%s, %s, %s, %s, %s)
-        """
-
-        # Sort by level to ensure parents are inserted first
+        # Sort by level so parents precede children in the load
         flat_themes.sort(key=lambda t: t["level"])
 
-        inserted = 0
+        # Bulk load via COPY (one statement instead of one INSERT per theme)
+        buf = io.StringIO()
         for theme in flat_themes:
-            cursor.execute(
-                insert_query,
-                (
-                    theme["code"],
-                    theme["label"],
-                    theme["full_name"],
-                    theme["level"],
-                    theme["parent_code"],
-                ),
+            buf.write(
+                copy_text_row(
+                    (
+                        theme["code"],
+                        theme["label"],
+                        theme["full_name"],
+                        theme["level"],
+                        theme["parent_code"],
+                    )
+                )
             )
-            inserted += 1
+        buf.seek(0)
+
+        cursor.copy_expert(
+            "COPY themes (code, label, full_name, level, parent_code) FROM STDIN",
+            buf,
+        )
+        inserted = cursor.rowcount
 
         # Commit transaction
         conn.commit()
         logger.success(f"✓ Successfully inserted {inserted} themes")
 
-        # Verify
-        cursor.execute("SELECT COUNT(*) FROM themes")
-        count = cursor.fetchone()[0]
-        logger.info(f"Total themes in database: {count}")
-
-        # Show distribution by level
+        # Verify: per-level counts plus the grand total (ROLLUP's NULL row,
+        # sorted last) in a single scan
         cursor.execute(
-            "SELECT level, COUNT(*) FROM themes GROUP BY level ORDER BY level"
+            "SELECT level, COUNT(*) FROM themes "
+            "GROUP BY ROLLUP (level) ORDER BY level NULLS LAST"
         )
+        *by_level, (_, total) = cursor.fetchall()
+        logger.info(f"Total themes in database: {total}")
+
+        # Show distribution by level
         logger.info("Distribution by level:")
-        for level, count in cursor.fetchall():
+        for level, count in by_level:
             logger.info(f"  Level {level}: {count} themes")
 
     except Exception as e:
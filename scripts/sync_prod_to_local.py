@@ -34,6 +34,7 @@ import argparse
 import atexit
 import os
 import signal
+import socket
 import subprocess
 import sys
 import time
@@ -54,6 +55,15 @@ CLOUD_SQL_PROXY_PORT = 5434
 CLOUD_SQL_DATABASE = "govbrnews"
 CLOUD_SQL_USER = "govbrnews_app"
 
+# HNSW index on news.content_embedding (see scripts/create_schema.sql). It is
+# dropped while embeddings are bulk-loaded and rebuilt once afterwards.
+EMBEDDING_HNSW_INDEX = "idx_news_content_embedding_hnsw"
+EMBEDDING_HNSW_INDEX_DDL = f"""
+    CREATE INDEX IF NOT EXISTS {EMBEDDING_HNSW_INDEX}
+    ON news USING hnsw (content_embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64)
+"""
+
 # Secret Manager secrets
 SECRET_PASSWORD = "govbrnews-postgres-password"
 
@@ -80,15 +90,11 @@ def get_secret(secret_id: str) -> str:
 
 
 def is_proxy_running() -> bool:
-    """Check if Cloud SQL Proxy is already running."""
+    """Check if Cloud SQL Proxy is already running (accepting connections on its port)."""
     try:
-        result = subprocess.run(
-            ["lsof", "-ti", f":{CLOUD_SQL_PROXY_PORT}"],
-            capture_output=True,
-            text=True,
-        )
-        return bool(result.stdout.strip())
-    except Exception:
+        with socket.create_connection(("127.0.0.1", CLOUD_SQL_PROXY_PORT), timeout=1):
+            return True
+    except OSError:
         return False
 
 
@@ -113,9 +119,12 @@ def start_cloud_sql_proxy() -> subprocess.Popen | None:
             stderr=subprocess.PIPE,
         )
 
-        # Wait for proxy to be ready
-        for i in range(10):
-            time.sleep(1)
+        # Wait for proxy to be ready (backoff from 50ms up to 1s, ~10s budget)
+        deadline = time.monotonic() + 10
+        delay = 0.05
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
             if is_proxy_running():
                 print(f"   ✓ Cloud SQL Proxy started (PID: {_proxy_process.pid})")
                 return _proxy_process
@@ -347,41 +356,56 @@ def sync_news(
     synced = 0
     offset = 0
 
-    with tqdm(total=total_count, desc="   Syncing news") as pbar:
-        while offset < total_count:
-            # Fetch batch from production
-            with prod_conn.cursor() as cur:
-                cur.execute(select_query, (start_date, end_date, batch_size, offset))
-                news_batch = cur.fetchall()
-
-            if not news_batch:
-                break
+    # Maintaining the HNSW graph row by row dominates the insert cost; drop it
+    # for the bulk load and build it once at the end
+    if has_embeddings:
+        with local_conn.cursor() as cur:
+            cur.execute(f"DROP INDEX IF EXISTS {EMBEDDING_HNSW_INDEX}")
+        local_conn.commit()
 
-            # Insert batch into local
+    try:
+        with tqdm(total=total_count, desc="   Syncing news") as pbar:
+            while offset < total_count:
+                # Fetch batch from production
+                with prod_conn.cursor() as cur:
+                    cur.execute(select_query, (start_date, end_date, batch_size, offset))
+                    news_batch = cur.fetchall()
+
+                if not news_batch:
+                    break
+
+                # Insert batch into local
+                with local_conn.cursor() as cur:
+                    if has_embeddings:
+                        insert_sql = f"""
+                            INSERT INTO news ({', '.join(insert_columns)}) VALUES %s
+                            ON CONFLICT (unique_id) DO UPDATE SET
+                                summary = EXCLUDED.summary,
+                                content_embedding = EXCLUDED.content_embedding,
+                                embedding_generated_at = EXCLUDED.embedding_generated_at,
+                                updated_at = NOW()
+                        """
+                    else:
+                        insert_sql = f"""
+                            INSERT INTO news ({', '.join(insert_columns)}) VALUES %s
+                            ON CONFLICT (unique_id) DO UPDATE SET
+                                summary = EXCLUDED.summary,
+                                updated_at = NOW()
+                        """
+                    execute_values(cur, insert_sql, news_batch)
+                local_conn.commit()
+
+                synced += len(news_batch)
+                offset += batch_size
+                pbar.update(len(news_batch))
+    finally:
+        if has_embeddings:
+            print("   Rebuilding embedding HNSW index...")
+            local_conn.rollback()
             with local_conn.cursor() as cur:
-                if has_embeddings:
-                    insert_sql = f"""
-                        INSERT INTO news ({', '.join(insert_columns)}) VALUES %s
-                        ON CONFLICT (unique_id) DO UPDATE SET
-                            summary = EXCLUDED.summary,
-                            content_embedding = EXCLUDED.content_embedding,
-                            embedding_generated_at = EXCLUDED.embedding_generated_at,
-                            updated_at = NOW()
-                    """
-                else:
-                    insert_sql = f"""
-                        INSERT INTO news ({', '.join(insert_columns)}) VALUES %s
-                        ON CONFLICT (unique_id) DO UPDATE SET
-                            summary = EXCLUDED.summary,
-                            updated_at = NOW()
-                    """
-                execute_values(cur, insert_sql, news_batch)
+                cur.execute(EMBEDDING_HNSW_INDEX_DDL)
             local_conn.commit()
 
-            synced += len(news_batch)
-            offset += batch_size
-            pbar.update(len(news_batch))
-
     # Reset sequence
     with local_conn.cursor() as cur:
         cur.execute("SELECT setval('news_id_seq', (SELECT COALESCE(MAX(id), 1) FROM news))")
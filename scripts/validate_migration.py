@@ -96,44 +96,40 @@ def validate_integrity(manager: PostgresManager) -> Dict[str, Any]:
     results = {}
 
     try:
-        # 1. Check for NULL required fields
-        logger.info("Checking required fields...")
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM news
-            WHERE unique_id IS NULL
-               OR agency_id IS NULL
-               OR title IS NULL
-               OR published_at IS NULL
-        """
-        )
-        null_required = cursor.fetchone()[0]
-        results["null_required_fields"] = null_required
+        # All checks read the same snapshot, so concurrent writes can't make
+        # the counts disagree with each other
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
 
-        # 2. Check agency_id validity
-        logger.info("Checking agency_id references...")
+        # 1-3, 5. Per-row checks in a single scan of news
+        logger.info("Checking required fields, references and theme coverage...")
         cursor.execute(
             """
-            SELECT COUNT(*) FROM news
-            WHERE agency_id NOT IN (SELECT id FROM agencies)
+            SELECT
+                COUNT(*) FILTER (
+                    WHERE unique_id IS NULL
+                       OR agency_id IS NULL
+                       OR title IS NULL
+                       OR published_at IS NULL
+                ),
+                COUNT(*) FILTER (WHERE agency_id NOT IN (SELECT id FROM agencies)),
+                COUNT(*) FILTER (
+                    WHERE (theme_l1_id IS NOT NULL AND theme_l1_id NOT IN (SELECT id FROM themes))
+                       OR (theme_l2_id IS NOT NULL AND theme_l2_id NOT IN (SELECT id FROM themes))
+                       OR (theme_l3_id IS NOT NULL AND theme_l3_id NOT IN (SELECT id FROM themes))
+                       OR (most_specific_theme_id IS NOT NULL AND most_specific_theme_id NOT IN (SELECT id FROM themes))
+                ),
+                COUNT(*) FILTER (WHERE most_specific_theme_id IS NOT NULL),
+                COUNT(*)
+            FROM news
         """
         )
-        invalid_agencies = cursor.fetchone()[0]
+        null_required, invalid_agencies, invalid_themes, with_theme, total = cursor.fetchone()
+        results["null_required_fields"] = null_required
         results["invalid_agencies"] = invalid_agencies
-
-        # 3. Check theme_id validity
-        logger.info("Checking theme_id references...")
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM news
-            WHERE (theme_l1_id IS NOT NULL AND theme_l1_id NOT IN (SELECT id FROM themes))
-               OR (theme_l2_id IS NOT NULL AND theme_l2_id NOT IN (SELECT id FROM themes))
-               OR (theme_l3_id IS NOT NULL AND theme_l3_id NOT IN (SELECT id FROM themes))
-               OR (most_specific_theme_id IS NOT NULL AND most_specific_theme_id NOT IN (SELECT id FROM themes))
-        """
-        )
-        invalid_themes = cursor.fetchone()[0]
         results["invalid_themes"] = invalid_themes
+        theme_pct = (with_theme / total * 100) if total > 0 else 0
+        results["records_with_theme"] = with_theme
+        results["theme_coverage_pct"] = theme_pct
 
         # 4. Check unique_id uniqueness
         logger.info("Checking unique_id uniqueness...")
@@ -150,15 +146,6 @@ def validate_integrity(manager: PostgresManager) -> Dict[str, Any]:
         duplicate_unique_ids = cursor.fetchone()[0]
         results["duplicate_unique_ids"] = duplicate_unique_ids
 
-        # 5. Count records with themes
-        logger.info("Checking theme coverage...")
-        cursor.execute("SELECT COUNT(*) FROM news WHERE most_specific_theme_id IS NOT NULL")
-        with_theme = cursor.fetchone()[0]
-        total = manager.count()
-        theme_pct = (with_theme / total * 100) if total > 0 else 0
-        results["records_with_theme"] = with_theme
-        results["theme_coverage_pct"] = theme_pct
-
         # 6. Check denormalized fields consistency
         logger.info("Checking denormalized field consistency...")
         cursor.execute(
@@ -174,6 +161,7 @@ def validate_integrity(manager: PostgresManager) -> Dict[str, Any]:
 
     finally:
         cursor.close()
+        conn.rollback()
         manager.put_connection(conn)
 
     # Log results
@@ -67,7 +67,7 @@ def sync_typesense(
     start_date: str = typer.Option(..., help="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = typer.Option(None, help="End date (YYYY-MM-DD)"),
     full_sync: bool = typer.Option(False, help="Force full sync (overwrite existing)"),
-    batch_size: int = typer.Option(1000, help="Batch size for Typesense upsert"),
+    batch_size: int = typer.Option(5000, help="Batch size for Typesense upsert"),
     max_records: Optional[int] = typer.Option(None, help="Max records to sync (for testing)"),
 ) -> None:
     """
@@ -32,6 +32,8 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Settings are read-only after load; frozen also makes them hashable
+        frozen=True,
     )
 
     # ==========================================================================
@@ -121,20 +121,29 @@ def batch_upsert_trending(db_url: str, scores_df: pd.DataFrame) -> int:
     from sqlalchemy.pool import NullPool
 
     engine = create_engine(db_url, poolclass=NullPool)
+    # One statement for the whole batch: parallel arrays unnested server-side
     upsert_sql = text("""
         INSERT INTO news_features (unique_id, features)
-        VALUES (:uid, :features)
+        SELECT * FROM unnest(CAST(:uids AS text[]), CAST(:features AS jsonb[]))
         ON CONFLICT (unique_id) DO UPDATE
-        SET features = news_features.features || :features,
+        SET features = news_features.features || EXCLUDED.features,
             updated_at = NOW()
     """)
-    count = 0
+    # Last score wins for repeated ids (ON CONFLICT can't touch a row twice)
+    scores = dict(zip(scores_df["unique_id"], scores_df["trending_score"].astype(float)))
+    count = len(scores)
     try:
-        with engine.begin() as conn:
-            for _, row in scores_df.iterrows():
-                features = json.dumps({"trending_score": float(row["trending_score"])})
-                conn.execute(upsert_sql, {"uid": row["unique_id"], "features": features})
-                count += 1
+        if scores:
+            with engine.begin() as conn:
+                conn.execute(
+                    upsert_sql,
+                    {
+                        "uids": list(scores),
+                        "features": [
+                            json.dumps({"trending_score": score}) for score in scores.values()
+                        ],
+                    },
+                )
         logger.info(f"Upserted {count} trending scores to news_features")
     finally:
         engine.dispose()
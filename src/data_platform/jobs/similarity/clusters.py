@@ -185,20 +185,28 @@ def batch_upsert_clusters(db_url: str, clusters: dict[str, list[str]]) -> int:
     from sqlalchemy.pool import NullPool
 
     engine = create_engine(db_url, poolclass=NullPool)
+    # One statement for the whole batch: parallel arrays unnested server-side
     upsert_sql = text("""
         INSERT INTO news_features (unique_id, features)
-        VALUES (:uid, :features)
+        SELECT * FROM unnest(CAST(:uids AS text[]), CAST(:features AS jsonb[]))
         ON CONFLICT (unique_id) DO UPDATE
-        SET features = news_features.features || :features,
+        SET features = news_features.features || EXCLUDED.features,
             updated_at = NOW()
     """)
-    count = 0
+    count = len(clusters)
     try:
-        with engine.begin() as conn:
-            for unique_id, similar_ids in clusters.items():
-                features = json.dumps({"similar_articles": similar_ids})
-                conn.execute(upsert_sql, {"uid": unique_id, "features": features})
-                count += 1
+        if clusters:
+            with engine.begin() as conn:
+                conn.execute(
+                    upsert_sql,
+                    {
+                        "uids": list(clusters),
+                        "features": [
+                            json.dumps({"similar_articles": similar_ids})
+                            for similar_ids in clusters.values()
+                        ],
+                    },
+                )
         logger.info(f"Upserted similar_articles for {count} articles")
     finally:
         engine.dispose()
@@ -16,16 +16,21 @@ from data_platform.typesense import (
     get_client,
     create_collection,
     index_documents,
-    calculate_published_week,
 )
+from data_platform.utils.datetime_utils import calculate_published_weeks
 
 logger = logging.getLogger(__name__)
 
 # Tamanho padrão do batch para leitura do PostgreSQL
 DEFAULT_PG_BATCH_SIZE = 5000
 
-# Tamanho padrão do batch para indexação no Typesense
-DEFAULT_TS_BATCH_SIZE = 1000
+# Tamanho padrão do batch para indexação no Typesense: igual ao do PostgreSQL,
+# assim cada página lida vira um único request de import (JSONL)
+DEFAULT_TS_BATCH_SIZE = DEFAULT_PG_BATCH_SIZE
+
+# Timeout (segundos) das requisições ao Typesense; imports de 5000 documentos
+# com embeddings passam facilmente dos 10s padrão do cliente
+TS_IMPORT_TIMEOUT = 120
 
 
 def sync_to_typesense(
@@ -46,7 +51,7 @@ def sync_to_typesense(
         start_date: Data inicial (YYYY-MM-DD)
         end_date: Data final (opcional, default: start_date)
         full_sync: Se True, força reindexação mesmo em coleção não vazia
-        batch_size: Tamanho do lote para indexação no Typesense (default: 1000)
+        batch_size: Tamanho do lote para indexação no Typesense (default: 5000)
         pg_batch_size: Tamanho do lote para leitura do PostgreSQL (default: 5000)
         limit: Número máximo de registros (para testes)
 
@@ -79,7 +84,7 @@ def sync_to_typesense(
 
     try:
         # Conectar ao Typesense
-        client = get_client()
+        client = get_client(timeout=TS_IMPORT_TIMEOUT)
 
         # Criar coleção se não existir
         create_collection(client)
@@ -123,8 +128,8 @@ def sync_to_typesense(
 
             # Calcular published_week
             if "published_at_ts" in df_batch.columns:
-                df_batch["published_week"] = df_batch["published_at_ts"].apply(
-                    calculate_published_week
+                df_batch["published_week"] = calculate_published_weeks(
+                    df_batch["published_at_ts"]
                 )
 
             # Indexar batch no Typesense
@@ -197,7 +202,7 @@ def _sync_small_dataset(
 
     # Calcular published_week
     if "published_at_ts" in df.columns:
-        df["published_week"] = df["published_at_ts"].apply(calculate_published_week)
+        df["published_week"] = calculate_published_weeks(df["published_at_ts"])
 
     logger.info(f"Encontradas {len(df)} notícias para indexar")
 
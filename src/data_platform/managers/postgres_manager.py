@@ -4,15 +4,19 @@ PostgreSQL Storage Manager for DestaquesGovBr.
 Manages news storage in PostgreSQL with connection pooling, caching, and error handling.
 """
 
+import io
 import os
 import subprocess
+import sys
+import weakref
 from collections.abc import Iterator
+from operator import attrgetter
 from typing import Any, cast
 from urllib.parse import quote_plus
 
 import pandas as pd
 from loguru import logger
-from psycopg2 import extensions, pool
+from psycopg2 import errors, extensions, pool
 from psycopg2.extras import RealDictCursor, execute_values
 from sqlalchemy import create_engine
 from sqlalchemy.pool import NullPool
@@ -20,6 +24,73 @@ from sqlalchemy.pool import NullPool
 from psycopg2.extras import Json
 
 from data_platform.models.news import Agency, News, NewsInsert, Theme
+from data_platform.utils.pg_copy import copy_text_row
+
+# Column order for INSERT INTO news; names match NewsInsert attributes.
+_NEWS_INSERT_COLUMNS = (
+    "unique_id",
+    "agency_id",
+    "theme_l1_id",
+    "theme_l2_id",
+    "theme_l3_id",
+    "most_specific_theme_id",
+    "title",
+    "url",
+    "image_url",
+    "video_url",
+    "category",
+    "tags",
+    "content",
+    "editorial_lead",
+    "subtitle",
+    "summary",
+    "published_at",
+    "updated_datetime",
+    "extracted_at",
+    "agency_key",
+    "agency_name",
+)
+_news_insert_row = attrgetter(*_NEWS_INSERT_COLUMNS)
+
+# Batches at least this large are loaded with COPY instead of INSERT ... VALUES
+_COPY_INSERT_THRESHOLD = 500
+
+# Server-side prepared statement name used by get_by_unique_id
+_GET_BY_UNIQUE_ID_STATEMENT = "get_news_by_unique_id"
+
+# Explicit column list for the prepared lookup: a cached ``SELECT *`` plan breaks
+# ("cached plan must not change result type") once a migration alters news.
+_NEWS_SELECT_COLUMNS = ", ".join(News.model_fields)
+
+def _news_conflict_clause(allow_update: bool) -> str:
+    """ON CONFLICT clause shared by insert() and bulk_insert()."""
+    if not allow_update:
+        return " ON CONFLICT (unique_id) DO NOTHING"
+    update_cols = [
+        c for c in _NEWS_INSERT_COLUMNS if c not in ["unique_id", "agency_id", "published_at"]
+    ]
+    update_set = ", ".join([f"{c} = EXCLUDED.{c}" for c in update_cols])
+    return f"""
+        ON CONFLICT (unique_id)
+        DO UPDATE SET {update_set}, updated_at = NOW()
+    """
+
+
+def _dedupe_news(news: list[NewsInsert], allow_update: bool) -> list[NewsInsert]:
+    """
+    Drop repeated unique_ids so a single statement never touches a row twice.
+
+    Upserts keep the last record per id (ON CONFLICT DO UPDATE can't affect a
+    row a second time); DO NOTHING keeps the first, as Postgres itself would.
+    """
+    by_id: dict[str, NewsInsert] = {}
+    if allow_update:
+        for n in news:
+            by_id[n.unique_id] = n
+    else:
+        for n in news:
+            by_id.setdefault(n.unique_id, n)
+    return list(by_id.values())
 
 
 class PostgresManager:
@@ -59,6 +130,9 @@ class PostgresManager:
         self._themes_by_id: dict[int, Theme] = {}
         self._cache_loaded = False
 
+        # Pooled connections that already hold the prepared lookup statements
+        self._prepared_conns: weakref.WeakSet[extensions.connection] = weakref.WeakSet()
+
     @property
     def engine(self):
         """Public access to SQLAlchemy engine for pandas read_sql operations."""
@@ -130,10 +204,14 @@ class PostgresManager:
         # Return original secret for direct connection
         return secret_conn_str
 
-    def _create_pool(self, min_conn: int, max_conn: int) -> pool.SimpleConnectionPool:
+    def _create_pool(self, min_conn: int, max_conn: int) -> pool.ThreadedConnectionPool:
         """
         Create connection pool.
 
+        Thread-safe, so one manager can be shared by concurrent batch workers
+        (e.g. process_in_batches(..., max_workers=N)); keep max_conn at least
+        as large as the number of workers.
+
         Args:
             min_conn: Minimum connections
             max_conn: Maximum connections
@@ -142,7 +220,7 @@ class PostgresManager:
             Connection pool
         """
         logger.info(f"Creating connection pool (min={min_conn}, max={max_conn})")
-        return pool.SimpleConnectionPool(
+        return pool.ThreadedConnectionPool(
             min_conn,
             max_conn,
             self.connection_string,
@@ -189,7 +267,8 @@ class PostgresManager:
             agencies = cursor.fetchall()
             for row in agencies:
                 agency = Agency(**row)
-                self._agencies_by_key[agency.key] = agency
+                # Interned keys compare by identity against literal lookups ("mec")
+                self._agencies_by_key[sys.intern(agency.key)] = agency
                 self._agencies_by_id[cast(int, agency.id)] = agency
 
             # Load themes
@@ -197,7 +276,7 @@ class PostgresManager:
             themes = cursor.fetchall()
             for row in themes:
                 theme = Theme(**row)
-                self._themes_by_code[theme.code] = theme
+                self._themes_by_code[sys.intern(theme.code)] = theme
                 self._themes_by_id[cast(int, theme.id)] = theme
 
             self._cache_loaded = True
@@ -256,6 +335,11 @@ class PostgresManager:
         if not news:
             raise ValueError("News list cannot be empty")
 
+        if len(news) >= _COPY_INSERT_THRESHOLD:
+            return self.bulk_insert(news, allow_update=allow_update)
+
+        news = _dedupe_news(news, allow_update)
+
         logger.info(f"Inserting {len(news)} news records (allow_update={allow_update})")
 
         conn = self.get_connection()
@@ -264,82 +348,18 @@ class PostgresManager:
         try:
             cursor = conn.cursor()
 
-            # Prepare INSERT query
-            columns = [
-                "unique_id",
-                "agency_id",
-                "theme_l1_id",
-                "theme_l2_id",
-                "theme_l3_id",
-                "most_specific_theme_id",
-                "title",
-                "url",
-                "image_url",
-                "video_url",
-                "category",
-                "tags",
-                "content",
-                "editorial_lead",
-                "subtitle",
-                "summary",
-                "published_at",
-                "updated_datetime",
-                "extracted_at",
-                "agency_key",
-                "agency_name",
-            ]
-
-            # Build values list
-            values = []
-            for n in news:
-                values.append(
-                    (
-                        n.unique_id,
-                        n.agency_id,
-                        n.theme_l1_id,
-                        n.theme_l2_id,
-                        n.theme_l3_id,
-                        n.most_specific_theme_id,
-                        n.title,
-                        n.url,
-                        n.image_url,
-                        n.video_url,
-                        n.category,
-                        n.tags,
-                        n.content,
-                        n.editorial_lead,
-                        n.subtitle,
-                        n.summary,
-                        n.published_at,
-                        n.updated_datetime,
-                        n.extracted_at,
-                        n.agency_key,
-                        n.agency_name,
-                    )
-                )
+            # Build positional rows straight from the model attributes
+            values = [_news_insert_row(n) for n in news]
 
-            # Base INSERT
             insert_query = f"""
-                INSERT INTO news ({", ".join(columns)})
+                INSERT INTO news ({", ".join(_NEWS_INSERT_COLUMNS)})
                 VALUES %s
             """
+            insert_query += _news_conflict_clause(allow_update)
 
-            if allow_update:
-                # ON CONFLICT UPDATE
-                update_cols = [
-                    c for c in columns if c not in ["unique_id", "agency_id", "published_at"]
-                ]
-                update_set = ", ".join([f"{c} = EXCLUDED.{c}" for c in update_cols])
-                insert_query += f"""
-                    ON CONFLICT (unique_id)
-                    DO UPDATE SET {update_set}, updated_at = NOW()
-                """
-            else:
-                # ON CONFLICT DO NOTHING
-                insert_query += " ON CONFLICT (unique_id) DO NOTHING"
-
-            # Execute batch insert
-            execute_values(cursor, insert_query, values)
+            # Execute batch insert as a single statement: execute_values defaults
+            # to pages of 100 rows, and rowcount would only cover the last page
+            execute_values(cursor, insert_query, values, page_size=len(values))
             inserted = cursor.rowcount
             conn.commit()
 
@@ -355,6 +375,69 @@ class PostgresManager:
             cursor.close()
             self.put_connection(conn)
 
+    def bulk_insert(self, news: list[NewsInsert], allow_update: bool = False) -> int:
+        """
+        Insert a large batch of news records via COPY.
+
+        Rows are streamed with COPY into a temporary staging table and then
+        moved into news with a single INSERT ... SELECT, which keeps the same
+        ON CONFLICT semantics as insert(). insert() delegates here for batches
+        of 500+ records.
+
+        Args:
+            news: List of news to insert
+            allow_update: If True, update existing records (ON CONFLICT UPDATE)
+
+        Returns:
+            Number of records inserted/updated
+
+        Raises:
+            ValueError: If news list is empty
+            psycopg2.Error: On database error
+        """
+        if not news:
+            raise ValueError("News list cannot be empty")
+
+        news = _dedupe_news(news, allow_update)
+
+        logger.info(f"Bulk inserting {len(news)} news records (allow_update={allow_update})")
+
+        columns = ", ".join(_NEWS_INSERT_COLUMNS)
+        buf = io.StringIO()
+        for n in news:
+            buf.write(copy_text_row(_news_insert_row(n)))
+        buf.seek(0)
+
+        conn = self.get_connection()
+
+        try:
+            cursor = conn.cursor()
+
+            # Same column types as news, but no constraints or defaults
+            cursor.execute(
+                f"CREATE TEMP TABLE news_stage ON COMMIT DROP AS "
+                f"SELECT {columns} FROM news WITH NO DATA"
+            )
+            cursor.copy_expert(f"COPY news_stage ({columns}) FROM STDIN", buf)
+            cursor.execute(
+                f"INSERT INTO news ({columns}) SELECT {columns} FROM news_stage"
+                + _news_conflict_clause(allow_update)
+            )
+            inserted = cursor.rowcount
+            conn.commit()
+
+            logger.success(f"Inserted/updated {inserted} news records")
+            return inserted  # type: ignore[no-any-return]
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error bulk inserting news: {e}")
+            raise
+
+        finally:
+            cursor.close()
+            self.put_connection(conn)
+
     def update(self, unique_id: str, updates: dict[str, Any]) -> bool:
         """
         Update news record by unique_id.
@@ -473,8 +556,55 @@ class PostgresManager:
         Returns:
             News object or None
         """
-        results = self.get(filters={"unique_id": unique_id}, limit=1)
-        return results[0] if results else None
+        conn = self.get_connection()
+
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            try:
+                row = self._execute_get_by_unique_id(conn, cursor, unique_id)
+            except (errors.FeatureNotSupported, errors.InvalidSqlStatementName) as e:
+                # Stale plan after a schema change, or the session lost the
+                # statement (e.g. DISCARD ALL): prepare it again and retry once.
+                logger.warning(f"Re-preparing {_GET_BY_UNIQUE_ID_STATEMENT}: {e}")
+                conn.rollback()
+                self._prepared_conns.discard(conn)
+                if isinstance(e, errors.FeatureNotSupported):
+                    cursor.execute(f"DEALLOCATE {_GET_BY_UNIQUE_ID_STATEMENT}")
+                row = self._execute_get_by_unique_id(conn, cursor, unique_id)
+
+            return News(**row) if row else None
+
+        finally:
+            cursor.close()
+            self.put_connection(conn)
+
+    def _execute_get_by_unique_id(
+        self, conn: extensions.connection, cursor: Any, unique_id: str
+    ) -> dict[str, Any] | None:
+        """Run the prepared unique_id lookup, preparing it on first use."""
+        self._ensure_prepared(conn, cursor)
+        cursor.execute(f"EXECUTE {_GET_BY_UNIQUE_ID_STATEMENT} (%s)", (unique_id,))
+        return cast(dict[str, Any] | None, cursor.fetchone())
+
+    def _ensure_prepared(self, conn: extensions.connection, cursor: Any) -> None:
+        """
+        Prepare the lookup statements once per pooled connection.
+
+        Prepared statements live in the server session (and survive rollbacks),
+        so each connection parses and plans them only on first use.
+
+        Args:
+            conn: Pooled database connection
+            cursor: Cursor on that connection
+        """
+        if conn in self._prepared_conns:
+            return
+
+        cursor.execute(
+            f"PREPARE {_GET_BY_UNIQUE_ID_STATEMENT} (text) AS "
+            f"SELECT {_NEWS_SELECT_COLUMNS} FROM news WHERE unique_id = $1"
+        )
+        self._prepared_conns.add(conn)
 
     def count(self, filters: dict[str, Any] | None = None) -> int:
         """
@@ -614,6 +744,12 @@ class PostgresManager:
         This method yields DataFrames in batches to avoid loading all data
         into memory at once, which is important for large datasets (300k+ records).
 
+        Rows are streamed from a server-side cursor inside a single read-only
+        transaction that stays open until the generator is exhausted or closed,
+        including while the consumer indexes each batch. The connection shows
+        as "idle in transaction" in pg_stat_activity meanwhile and holds its
+        snapshot, which delays vacuum on news for long syncs.
+
         Args:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD), defaults to start_date
@@ -640,28 +776,42 @@ class PostgresManager:
             WHERE n.published_at >= %s
               AND n.published_at < %s::date + INTERVAL '1 day'
             ORDER BY n.published_at DESC
-            LIMIT %s OFFSET %s
         """
 
-        offset = 0
+        # Server-side (named) cursor: the query is planned and executed once and
+        # rows are streamed batch_size at a time, instead of re-running it with
+        # a growing OFFSET for every batch.
+        conn = self.get_connection()
+        fetched = 0
         batch_num = 0
+        try:
+            with conn.cursor() as setup:
+                setup.execute("SET TRANSACTION READ ONLY")
 
-        while offset < total_count:
-            params = (start_date, end_date, batch_size, offset)
-            df = pd.read_sql_query(base_query, self._engine, params=params)
+            with conn.cursor(name="iter_news_for_typesense") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(base_query, (start_date, end_date))
 
-            if df.empty:
-                break
+                # Named cursors only get a description after the first fetch
+                rows = cursor.fetchmany(batch_size)
+                columns = [desc[0] for desc in cursor.description or ()]
 
-            batch_num += 1
-            logger.info(
-                f"Fetched batch {batch_num}: {len(df)} records "
-                f"(offset: {offset}, total: {total_count})"
-            )
+                while rows:
+                    df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
 
-            yield df
+                    batch_num += 1
+                    fetched += len(df)
+                    logger.info(
+                        f"Fetched batch {batch_num}: {len(df)} records "
+                        f"(fetched: {fetched}, total: {total_count})"
+                    )
 
-            offset += batch_size
+                    yield df
+                    rows = cursor.fetchmany(batch_size)
+        finally:
+            # Ends the read-only transaction, also when the consumer stops early
+            conn.rollback()
+            self.put_connection(conn)
 
     def get_news_for_typesense(
         self,
@@ -755,6 +905,52 @@ class PostgresManager:
             cursor.close()
             self.put_connection(conn)
 
+    def upsert_features_batch(self, features_by_id: dict[str, dict[str, Any]]) -> int:
+        """
+        Merge features for multiple articles in a single statement.
+
+        Same merge semantics as upsert_features(), but all rows are sent as one
+        multi-row INSERT (one parse/plan, one round-trip, one commit).
+
+        Args:
+            features_by_id: Dictionary mapping unique_id to features dict.
+                Entries with empty features are skipped.
+
+        Returns:
+            Number of rows inserted/updated
+        """
+        rows = [(uid, Json(features)) for uid, features in features_by_id.items() if features]
+        if not rows:
+            return 0
+
+        conn = self.get_connection()
+
+        try:
+            cursor = conn.cursor()
+
+            query = """
+                INSERT INTO news_features (unique_id, features)
+                VALUES %s
+                ON CONFLICT (unique_id) DO UPDATE SET
+                    features = news_features.features || EXCLUDED.features
+            """
+
+            execute_values(cursor, query, rows, page_size=len(rows))
+            updated = cursor.rowcount
+            conn.commit()
+
+            logger.debug(f"Upserted features for {updated} articles")
+            return updated  # type: ignore[no-any-return]
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error upserting features batch: {e}")
+            raise
+
+        finally:
+            cursor.close()
+            self.put_connection(conn)
+
     def get_features(self, unique_id: str) -> dict[str, Any] | None:
         """
         Get features for an article.
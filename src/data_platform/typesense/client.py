@@ -95,17 +95,21 @@ def wait_for_typesense(
     port: str | None = None,
     api_key: str | None = None,
     max_retries: int = 30,
-    retry_interval: int = 2,
+    retry_interval: float = 2,
 ) -> typesense.Client | None:
     """
     Aguarda o servidor Typesense ficar pronto e retorna um cliente.
 
+    As tentativas usam backoff exponencial (0.05s, 0.1s, 0.2s, ...) limitado a
+    retry_interval, de modo que um servidor já pronto é detectado quase de
+    imediato sem encurtar muito a espera total quando ele demora a subir.
+
     Args:
         host: Host do servidor Typesense
         port: Porta do servidor
         api_key: Chave de API
         max_retries: Número máximo de tentativas (default: 30)
-        retry_interval: Intervalo entre tentativas em segundos (default: 2)
+        retry_interval: Intervalo máximo entre tentativas em segundos (default: 2)
 
     Returns:
         typesense.Client se conectado, None se timeout
@@ -113,23 +117,28 @@ def wait_for_typesense(
     host = host or os.getenv("TYPESENSE_HOST", "localhost")
     port = port or os.getenv("TYPESENSE_PORT", "8108")
 
-    retry_count = 0
+    health_url = f"http://{host}:{port}/health"
 
-    while retry_count < max_retries:
-        try:
-            health_url = f"http://{host}:{port}/health"
-            response = requests.get(health_url, timeout=5)
+    # Uma única sessão reaproveita a conexão HTTP (keep-alive) entre tentativas
+    with requests.Session() as session:
+        for attempt in range(1, max_retries + 1):
+            try:
+                response = session.get(health_url, timeout=5)
+
+                if response.status_code == 200:
+                    logger.info("Typesense está pronto!")
+                    return get_client(host=host, port=port, api_key=api_key)
+
+                reason: Exception | str = f"HTTP {response.status_code}"
 
-            if response.status_code == 200:
-                logger.info("Typesense está pronto!")
-                return get_client(host=host, port=port, api_key=api_key)
+            except Exception as e:
+                reason = e
 
-        except Exception as e:
-            retry_count += 1
             logger.info(
-                f"Typesense não está pronto, tentativa {retry_count}/{max_retries}: {e}"
+                f"Typesense não está pronto, tentativa {attempt}/{max_retries}: {reason}"
             )
-            time.sleep(retry_interval)
+            if attempt < max_retries:
+                time.sleep(min(0.05 * 2 ** (attempt - 1), retry_interval))
 
     logger.error("Typesense não ficou pronto após todas as tentativas")
     return None
@@ -4,28 +4,41 @@ Utility functions for data-platform.
 This package contains shared utilities used across the codebase:
 - datetime_utils: Date/time parsing and formatting
 - batch: Batch processing utilities
+- pg_copy: PostgreSQL COPY text-format rendering
+- yaml_utils: YAML loading
 """
 
 from data_platform.utils.datetime_utils import (
     calculate_published_week,
+    calculate_published_weeks,
     parse_date,
     to_timestamp,
 )
 from data_platform.utils.batch import (
     batch_iterator,
+    OnError,
     process_in_batches,
     chunked,
     calculate_batch_stats,
 )
+from data_platform.utils.pg_copy import copy_text_field, copy_text_row
+from data_platform.utils.yaml_utils import load_yaml
 
 __all__ = [
     # Datetime utils
     "calculate_published_week",
+    "calculate_published_weeks",
     "parse_date",
     "to_timestamp",
     # Batch utils
     "batch_iterator",
+    "OnError",
     "process_in_batches",
     "chunked",
     "calculate_batch_stats",
+    # COPY utils
+    "copy_text_field",
+    "copy_text_row",
+    # YAML utils
+    "load_yaml",
 ]
@@ -11,6 +11,9 @@ Functions:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import IntEnum
+from itertools import islice
 from typing import Iterator, TypeVar, Callable, Iterable, Any
 
 import pandas as pd
@@ -20,6 +23,13 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class OnError(IntEnum):
+    """Error handling strategy for process_in_batches."""
+
+    CONTINUE = 0
+    STOP = 1
+
+
 def batch_iterator(
     total_count: int,
     batch_size: int,
@@ -71,7 +81,8 @@ def process_in_batches(
     items: list[T],
     batch_size: int,
     process_fn: Callable[[list[T]], Any],
-    on_error: str = "continue",
+    on_error: str | OnError = OnError.CONTINUE,
+    max_workers: int = 1,
 ) -> dict[str, int]:
     """
     Process a list of items in batches with error handling.
@@ -83,9 +94,15 @@ def process_in_batches(
         items: List of items to process
         batch_size: Number of items per batch
         process_fn: Function to process each batch
-        on_error: Error handling strategy:
+        on_error: Error handling strategy, as an OnError member or its
+            lowercase name:
             - "continue": Continue processing remaining batches (default)
             - "stop": Stop processing on first error
+            Any other value continues.
+        max_workers: Number of threads processing batches concurrently
+            (default: 1, serial). Use >1 only for I/O-bound process_fn that
+            is safe to call from several threads. With "stop", batches not yet
+            started are cancelled; batches already running still finish.
 
     Returns:
         Dictionary with statistics:
@@ -108,23 +125,48 @@ def process_in_batches(
         "batches_failed": 0,
     }
 
+    # Anything other than "stop" continues, as with the original string parameter
+    stop_on_error = on_error in (OnError.STOP, "stop")
+
     if not items:
         return stats
 
-    for i in range(0, len(items), batch_size):
-        batch = items[i : i + batch_size]
+    def record(batch: list[T], error: BaseException | None) -> None:
         stats["batches_total"] += 1
-
-        try:
-            process_fn(batch)
+        if error is None:
             stats["processed"] += len(batch)
             stats["batches_success"] += 1
-        except Exception as e:
+        else:
             stats["errors"] += len(batch)
             stats["batches_failed"] += 1
-            logger.error(f"Batch {stats['batches_total']} failed: {e}")
+            logger.error(f"Batch {stats['batches_total']} failed: {error}")
+
+    if max_workers <= 1:
+        for i in range(0, len(items), batch_size):
+            batch = items[i : i + batch_size]
+            try:
+                process_fn(batch)
+            except Exception as e:
+                record(batch, e)
+                if stop_on_error:
+                    break
+            else:
+                record(batch, None)
+        return stats
 
-            if on_error == "stop":
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        futures = {executor.submit(process_fn, batch): batch for batch in batches}
+        pending = set(futures)
+        # Stats are only touched from this thread, as each future completes
+        for future in as_completed(futures):
+            pending.discard(future)
+            error = future.exception()
+            record(futures[future], error)
+            if error is not None and stop_on_error:
+                for other in pending:
+                    if not other.cancel():
+                        record(futures[other], other.exception())
                 break
 
     return stats
@@ -151,13 +193,8 @@ def chunked(iterable: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
         >>> for chunk in chunked(range(1000), 100):
         ...     process_chunk(chunk)
     """
-    chunk = []
-    for item in iterable:
-        chunk.append(item)
-        if len(chunk) >= chunk_size:
-            yield chunk
-            chunk = []
-    if chunk:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
         yield chunk
 
 
@@ -8,13 +8,20 @@ Functions:
     parse_date: Parse various date formats to datetime
     to_timestamp: Convert datetime to Unix timestamp
     calculate_published_week: Calculate ISO week ID (YYYYWW format)
+    calculate_published_weeks: Vectorized calculate_published_week
 """
 
+import time
 from datetime import datetime, date, timezone
-from typing import Union
+from functools import lru_cache
+from typing import Any, Union
 
+import numpy as np
 import pandas as pd
 
+# Largest timestamp with a week ID: 9999-12-31T23:59:59Z
+_MAX_TIMESTAMP = 253402300799
+
 
 def parse_date(value: Union[str, datetime, date, int, float, None]) -> datetime | None:
     """
@@ -61,10 +68,16 @@ def parse_date(value: Union[str, datetime, date, int, float, None]) -> datetime
             return None
 
     if isinstance(value, str):
-        if not value.strip():
+        value = value.strip()
+        if not value:
             return None
         try:
-            # Try pandas for flexible parsing
+            # Fast path: ISO 8601 (dates, datetimes, offsets and trailing "Z")
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        try:
+            # Fall back to pandas for flexible parsing
             return pd.to_datetime(value).to_pydatetime()
         except Exception:
             return None
@@ -128,14 +141,71 @@ def calculate_published_week(timestamp: int | float | None) -> int | None:
     if pd.isna(timestamp) or timestamp is None or timestamp <= 0:
         return None
 
+    if timestamp > _MAX_TIMESTAMP:
+        return None
+
     try:
-        dt = pd.to_datetime(timestamp, unit="s")
-        iso_year, iso_week, _ = dt.isocalendar()
-        return int(iso_year * 100 + iso_week)
+        return _week_for_day(int(timestamp) // 86400)
     except Exception:
         return None
 
 
+@lru_cache(maxsize=4096)
+def _week_for_day(day: int) -> int:
+    """ISO week ID (YYYYWW) of a Unix epoch day, computed once per day."""
+    # ISO weeks belong to the year of their Thursday; 1970-01-01 was a Thursday
+    thursday = day - (day + 3) % 7 + 3
+    iso_year = _year_from_days(thursday)
+    return iso_year * 100 + (thursday - _days_from_year(iso_year)) // 7 + 1
+
+
+def _year_from_days(day: int) -> int:
+    """Gregorian year of a Unix epoch day (Hinnant's civil_from_days)."""
+    z = day + 719468  # shift the epoch to 0000-03-01
+    era = z // 146097
+    doe = z - era * 146097  # day of 400-year era, [0, 146096]
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)  # day of March-based year
+    # Days from March 1 past Dec 31 (306 = Mar..Dec) fall in the next civil year
+    return yoe + era * 400 + (doy >= 306)
+
+
+def _days_from_year(year: int) -> int:
+    """Unix epoch day of January 1st of year (Hinnant's days_from_civil)."""
+    y = year - 1  # January belongs to the previous March-based year
+    era = y // 400
+    yoe = y - era * 400
+    return era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + 306 - 719468
+
+
+def calculate_published_weeks(timestamps: Any) -> np.ndarray:
+    """
+    Vectorized calculate_published_week over an array of Unix timestamps.
+
+    Args:
+        timestamps: Sequence, Series or array of Unix timestamps in seconds
+
+    Returns:
+        float64 array of YYYYWW week IDs, NaN where the timestamp is missing
+        or invalid (same cases where calculate_published_week returns None)
+
+    Examples:
+        >>> calculate_published_weeks([1704067200, 1736899200, None])
+        array([202401., 202503., nan])
+    """
+    ts = np.asarray(timestamps, dtype="float64")
+    valid = np.isfinite(ts) & (ts > 0) & (ts <= _MAX_TIMESTAMP)
+
+    days = np.where(valid, ts, 0).astype("int64") // 86400
+    # ISO weeks belong to the year of their Thursday; 1970-01-01 was a Thursday
+    thursday = days - (days + 3) % 7 + 3
+    iso_year_start = thursday.astype("datetime64[D]").astype("datetime64[Y]")
+    iso_week = (thursday - iso_year_start.astype("datetime64[D]").astype("int64")) // 7 + 1
+    iso_year = iso_year_start.astype("int64") + 1970
+
+    return np.where(valid, iso_year * 100 + iso_week, np.nan)
+
+
 def format_date_range(start_date: str, end_date: str | None = None) -> tuple[str, str]:
     """
     Format and validate a date range.
@@ -165,7 +235,7 @@ def get_current_timestamp() -> int:
     Returns:
         Current Unix timestamp as int
     """
-    return int(datetime.now(timezone.utc).timestamp())
+    return int(time.time())
 
 
 def get_today_str() -> str:
@@ -0,0 +1,56 @@
+"""
+PostgreSQL COPY helpers for data-platform.
+
+This module renders Python values in COPY's text format, shared by the
+PostgresManager bulk loads and the master-data populate scripts.
+
+Functions:
+    copy_text_field: Render one value for COPY ... FROM STDIN (text format)
+    copy_text_row: Render a row as one COPY text-format line
+"""
+
+from typing import Any, Iterable
+
+# Backslash is escaped first, so a literal "\N" in the data never reads as NULL
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_text_field(value: Any) -> str:
+    """
+    Render one value for COPY ... FROM STDIN (text format).
+
+    Args:
+        value: Column value; None becomes NULL and lists become array literals
+
+    Returns:
+        Escaped field text
+
+    Examples:
+        >>> copy_text_field(None)
+        '\\\\N'
+        >>> copy_text_field("a\\tb")
+        'a\\\\tb'
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, list):
+        items = (str(v).replace("\\", "\\\\").replace('"', '\\"') for v in value)
+        value = "{" + ",".join(f'"{item}"' for item in items) + "}"
+    return str(value).translate(_COPY_TEXT_ESCAPES)
+
+
+def copy_text_row(values: Iterable[Any]) -> str:
+    """
+    Render a row as one COPY text-format line.
+
+    Args:
+        values: Column values in the order of the COPY column list
+
+    Returns:
+        Tab-separated, newline-terminated line
+
+    Examples:
+        >>> copy_text_row(("mec", None, 3))
+        'mec\\t\\\\N\\t3\\n'
+    """
+    return "\t".join(map(copy_text_field, values)) + "\n"
@@ -0,0 +1,30 @@
+"""
+YAML utilities for data-platform.
+
+Functions:
+    load_yaml: Parse a YAML document with the fastest available safe loader
+"""
+
+from typing import IO, Any
+
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it; pure-Python otherwise
+_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: str | IO[str]) -> Any:
+    """
+    Parse a YAML document with safe_load semantics.
+
+    Args:
+        stream: YAML text or an open text file
+
+    Returns:
+        Parsed document (dicts, lists and scalars only)
+
+    Examples:
+        >>> load_yaml("themes: []")
+        {'themes': []}
+    """
+    return yaml.load(stream, Loader=_SAFE_LOADER)
@@ -5,6 +5,7 @@ import json
 import re
 import unicodedata
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import textstat
@@ -16,6 +17,8 @@ _WORD_CHAR = r"[0-9A-Za-zÀ-ÿ]"
 _BOUNDARY_BEFORE = rf"(?<!{_WORD_CHAR})"
 _BOUNDARY_AFTER = rf"(?!{_WORD_CHAR})"
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def compute_word_count(content: str | None) -> int:
     if not content:
@@ -100,11 +103,17 @@ def _fold_surface(text: str) -> str:
     ``\\s+`` so it tolerates runs of whitespace/newlines in the content).
     """
     folded, _ = _fold_with_map(text)
-    return re.sub(r"\s+", " ", folded).strip()
+    return _WHITESPACE_RE.sub(" ", folded).strip()
 
 
+@lru_cache(maxsize=4096)
 def _surface_pattern(folded_surface: str) -> re.Pattern[str]:
-    """Build a word-boundary regex for a folded surface (whitespace → ``\\s+``)."""
+    """
+    Build a word-boundary regex for a folded surface (whitespace → ``\\s+``).
+
+    Cached: the same entity surfaces recur across articles, and ``re``'s own
+    cache (512 entries) is shared with every other pattern in the process.
+    """
     parts = [re.escape(tok) for tok in folded_surface.split(" ")]
     body = r"\s+".join(parts)
     return re.compile(f"{_BOUNDARY_BEFORE}{body}{_BOUNDARY_AFTER}")
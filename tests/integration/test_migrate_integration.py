@@ -4,20 +4,30 @@ Integration tests for the database migration system.
 Validates that all migrations can run sequentially against a real PostgreSQL
 database, are idempotent (safe to re-execute), and support rollback.
 
-Requires: PostgreSQL with pgvector extension (docker compose up).
+Requires: PostgreSQL with pgvector extension (docker compose up). Tests fail
+without it unless MIGRATION_TEST_SKIP_WITHOUT_PGVECTOR=1 is set.
 """
 
+import importlib.util
+import io
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 
 import psycopg2
 import pytest
+from loguru import logger
 
 SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
 MIGRATE_SCRIPT = SCRIPTS_DIR / "migrate.py"
 MIGRATIONS_DIR = SCRIPTS_DIR / "migrations"
+MIGRATE_TIMEOUT = 120
+
+# In-process runs that timed out; their threads may still hold DB locks
+_timed_out_runs: list[str] = []
 
 DATABASE_URL = os.getenv(
     "MIGRATION_TEST_DATABASE_URL",
@@ -126,12 +136,54 @@ CREATE TABLE IF NOT EXISTS schema_version (
 """
 
 
+@cache
+def _migrate_app():
+    """Load scripts/migrate.py once and build its typer app for in-process runs."""
+    spec = importlib.util.spec_from_file_location("migrate", MIGRATE_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.build_app()
+
+
 def _run_migrate(*args: str, needs_db: bool = True) -> subprocess.CompletedProcess:
-    """Run the migrate.py script with given arguments."""
-    cmd = [sys.executable, str(MIGRATE_SCRIPT), *args]
+    """Run the migrate.py CLI with given arguments.
+
+    Runs in-process via typer's CliRunner to skip interpreter start-up on every
+    call; set DATA_PLATFORM_TEST_SUBPROCESS=1 to exercise the real script instead.
+    Both paths give up after MIGRATE_TIMEOUT seconds. A timed-out subprocess is
+    killed, but an in-process run can't be: its thread is left running with the
+    CliRunner stdio swap and its connection, so every later test in the module
+    fails instead of resetting the schema underneath it. migrate.py logs through
+    loguru, whose default sink is the real stderr, so the in-process path adds a
+    temporary sink and appends those logs to the returned stderr.
+    """
+    argv = list(args)
     if needs_db:
-        cmd.extend(["--db-url", DATABASE_URL])
-    return subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        argv.extend(["--db-url", DATABASE_URL])
+    if os.getenv("DATA_PLATFORM_TEST_SUBPROCESS") == "1":
+        cmd = [sys.executable, str(MIGRATE_SCRIPT), *argv]
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=MIGRATE_TIMEOUT)
+
+    from typer.testing import CliRunner
+
+    logs = io.StringIO()
+    sink_id = logger.add(logs, format="{level} | {message}")
+    # No context manager: on timeout the stuck worker is abandoned instead of joined
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(CliRunner().invoke, _migrate_app(), argv)
+        result = future.result(timeout=MIGRATE_TIMEOUT)
+    except TimeoutError:
+        _timed_out_runs.append(" ".join(args))
+        pytest.fail(f"migrate {_timed_out_runs[-1]} did not finish within {MIGRATE_TIMEOUT}s")
+    finally:
+        executor.shutdown(wait=False)
+        logger.remove(sink_id)
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        raise result.exception
+    return subprocess.CompletedProcess(
+        argv, result.exit_code, result.stdout, result.stderr + logs.getvalue()
+    )
 
 
 def _apply_concurrent_migration(version: str):
@@ -151,29 +203,47 @@ def _apply_concurrent_migration(version: str):
     _run_migrate("stamp", version, "--yes")
 
 
-def _reset_database():
-    """Drop and recreate the test database schema."""
+def _reset_database(conn):
+    """Drop and recreate the test database schema (conn must be in autocommit mode)."""
+    with conn.cursor() as cur:
+        cur.execute("DROP SCHEMA public CASCADE; CREATE SCHEMA public;")
+        # Multi-statement simple query: runs as a single implicit transaction
+        cur.execute(BASELINE_SQL)
+
+
+@cache
+def _pgvector_available() -> bool:
+    """Whether the server ships pgvector (probed once, without a failing CREATE EXTENSION)."""
     conn = psycopg2.connect(DATABASE_URL)
-    conn.autocommit = True
     try:
         with conn.cursor() as cur:
-            cur.execute("DROP SCHEMA public CASCADE; CREATE SCHEMA public;")
+            cur.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'vector'")
+            return cur.fetchone() is not None
     finally:
         conn.close()
 
+
+@pytest.fixture(scope="module")
+def db_conn():
+    """One autocommit connection shared by the module's setup and assertions."""
     conn = psycopg2.connect(DATABASE_URL)
-    try:
-        with conn.cursor() as cur:
-            cur.execute(BASELINE_SQL)
-        conn.commit()
-    finally:
-        conn.close()
+    conn.autocommit = True
+    yield conn
+    conn.close()
 
 
 @pytest.fixture(autouse=True)
-def fresh_database():
+def fresh_database(db_conn):
     """Reset database to baseline state before each test."""
-    _reset_database()
+    if _timed_out_runs:
+        pytest.fail(f"Aborted: migrate {_timed_out_runs[0]} timed out and may still hold locks")
+    if not _pgvector_available():
+        # A test database without pgvector is a misconfiguration, not a pass
+        message = "pgvector extension not available on the test server"
+        if os.getenv("MIGRATION_TEST_SKIP_WITHOUT_PGVECTOR") == "1":
+            pytest.skip(message)
+        pytest.fail(f"{message} (set MIGRATION_TEST_SKIP_WITHOUT_PGVECTOR=1 to skip)")
+    _reset_database(db_conn)
     yield
 
 
@@ -275,39 +345,29 @@ class TestMigrationSequence:
         assert result.returncode == 0
         assert "migration(s) processed" in result.stdout
 
-    def test_migrate_after_manual_application(self):
+    def test_migrate_after_manual_application(self, db_conn):
         """Migration applied manually (no history) is re-executed safely (idempotent)."""
         # Apply migrations 001-007 via runner
         result = _run_migrate("migrate", "--target", "007", "--yes")
         assert result.returncode == 0, f"Setup failed:\n{result.stdout}\n{result.stderr}"
 
-        # Apply migration 008 SQL directly (simulating DBA in Cloud Console)
-        conn = psycopg2.connect(DATABASE_URL)
-        try:
-            with conn.cursor() as cur:
-                sql = (MIGRATIONS_DIR / "008_create_scrape_runs.sql").read_text()
-                cur.execute(sql)
-            conn.commit()
-        finally:
-            conn.close()
-
-        # Verify: table exists but NO history record for 008
-        conn = psycopg2.connect(DATABASE_URL)
-        try:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT EXISTS (SELECT 1 FROM information_schema.tables "
-                    "WHERE table_name = 'scrape_runs')"
-                )
-                assert cur.fetchone()[0] is True
-                cur.execute(
-                    "SELECT COUNT(*) FROM migration_history "
-                    "WHERE version = '008' AND operation = 'migrate' "
-                    "AND status = 'success'"
-                )
-                assert cur.fetchone()[0] == 0
-        finally:
-            conn.close()
+        with db_conn.cursor() as cur:
+            # Apply migration 008 SQL directly (simulating DBA in Cloud Console)
+            sql = (MIGRATIONS_DIR / "008_create_scrape_runs.sql").read_text()
+            cur.execute(sql)
+
+            # Verify: table exists but NO history record for 008
+            cur.execute(
+                "SELECT EXISTS (SELECT 1 FROM information_schema.tables "
+                "WHERE table_name = 'scrape_runs')"
+            )
+            assert cur.fetchone()[0] is True
+            cur.execute(
+                "SELECT COUNT(*) FROM migration_history "
+                "WHERE version = '008' AND operation = 'migrate' "
+                "AND status = 'success'"
+            )
+            assert cur.fetchone()[0] == 0
 
         # Run migrate — should detect 008 as pending, re-execute (no-op), succeed
         result = _run_migrate("migrate", "--yes")
@@ -11,6 +11,7 @@ import pytest
 
 from data_platform.managers import PostgresManager
 from data_platform.models import NewsInsert
+from data_platform.utils import process_in_batches
 
 
 @pytest.mark.integration
@@ -153,3 +154,23 @@ class TestPostgresIntegration:
         assert news.title == "Updated via Insert"
 
         # No manual cleanup needed - cleanup_news fixture handles it
+
+    def test_concurrent_batch_inserts_share_pool(
+        self,
+        postgres_manager: PostgresManager,
+        news_factory: callable,
+        cleanup_news: list[str],
+    ) -> None:
+        """Concurrent insert() calls from worker threads share the manager's pool."""
+        batch = [news_factory() for _ in range(40)]
+        cleanup_news.extend(n.unique_id for n in batch)
+
+        stats = process_in_batches(
+            batch, batch_size=10, process_fn=postgres_manager.insert, max_workers=4
+        )
+
+        assert stats["processed"] == 40
+        assert stats["batches_failed"] == 0
+        assert postgres_manager.get_by_unique_id(batch[-1].unique_id) is not None
+
+        # No manual cleanup needed - cleanup_news fixture handles it
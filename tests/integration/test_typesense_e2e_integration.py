@@ -18,32 +18,30 @@ from data_platform.managers import PostgresManager
 from data_platform.typesense.indexer import prepare_document
 
 
+@pytest.fixture
+def today_document(postgres_manager: PostgresManager, typesense_test_data: dict) -> dict:
+    """Typesense document prepared from today's article in typesense_test_data."""
+    df = postgres_manager.get_news_for_typesense(typesense_test_data["dates"]["today"])
+
+    assert len(df) == 1, "Should have 1 article for today"
+
+    return prepare_document(df.iloc[0])
+
+
 @pytest.mark.integration
 class TestTypesenseE2ESync:
     """Tests for PostgreSQL → Typesense E2E sync."""
 
     def test_index_document_roundtrip(
         self,
-        postgres_manager: PostgresManager,
         typesense_client,
         typesense_test_collection: str,
-        typesense_test_data: dict,
+        today_document: dict,
     ) -> None:
         """Complete roundtrip: PG → prepare → Typesense → search."""
-        # Get news from PostgreSQL
-        df = postgres_manager.get_news_for_typesense(
-            typesense_test_data["dates"]["today"]
-        )
-
-        assert len(df) == 1, "Should have 1 article for today"
-
-        # Prepare document
-        row = df.iloc[0]
-        document = prepare_document(row)
-
         # Index in Typesense
         result = typesense_client.collections[typesense_test_collection].documents.upsert(
-            document
+            today_document
         )
 
         # Verify upsert succeeded
@@ -70,29 +68,19 @@ class TestTypesenseE2ESync:
 
     def test_collection_schema_compatibility(
         self,
-        postgres_manager: PostgresManager,
         typesense_client,
         typesense_test_collection: str,
-        typesense_test_data: dict,
+        today_document: dict,
     ) -> None:
         """PostgreSQL document is accepted by Typesense schema."""
-        # Get news from PostgreSQL
-        df = postgres_manager.get_news_for_typesense(
-            typesense_test_data["dates"]["today"]
-        )
-
-        # Prepare document
-        row = df.iloc[0]
-        document = prepare_document(row)
-
         # Attempt to index (should not raise schema validation error)
         result = typesense_client.collections[typesense_test_collection].documents.upsert(
-            document
+            today_document
         )
 
         # Verify success
         assert "id" in result
-        assert result["id"] == document["id"]
+        assert result["id"] == today_document["id"]
 
     def test_batch_indexing(
         self,
@@ -137,26 +125,17 @@ class TestTypesenseE2ESync:
 
     def test_document_fields_preserved(
         self,
-        postgres_manager: PostgresManager,
         typesense_client,
         typesense_test_collection: str,
-        typesense_test_data: dict,
+        today_document: dict,
     ) -> None:
         """All important fields are preserved in roundtrip."""
-        # Get news from PostgreSQL
-        df = postgres_manager.get_news_for_typesense(
-            typesense_test_data["dates"]["today"]
-        )
-
-        row = df.iloc[0]
-        document = prepare_document(row)
-
         # Index
-        typesense_client.collections[typesense_test_collection].documents.upsert(document)
+        typesense_client.collections[typesense_test_collection].documents.upsert(today_document)
 
         # Retrieve document by ID
         retrieved = typesense_client.collections[typesense_test_collection].documents[
-            document["id"]
+            today_document["id"]
         ].retrieve()
 
         # Verify core fields
@@ -177,35 +156,26 @@ class TestTypesenseE2ESync:
 
     def test_embeddings_preserved(
         self,
-        postgres_manager: PostgresManager,
         typesense_client,
         typesense_test_collection: str,
-        typesense_test_data: dict,
+        today_document: dict,
     ) -> None:
         """768-dim embedding vectors are preserved."""
-        # Get news from PostgreSQL
-        df = postgres_manager.get_news_for_typesense(
-            typesense_test_data["dates"]["today"]
-        )
-
-        row = df.iloc[0]
-        document = prepare_document(row)
-
         # Verify embedding in prepared document
-        if "content_embedding" in document and document["content_embedding"]:
+        if "content_embedding" in today_document and today_document["content_embedding"]:
             # Should have 768 dimensions
-            embedding = document["content_embedding"]
+            embedding = today_document["content_embedding"]
             assert isinstance(embedding, list), "Embedding should be a list"
             assert len(embedding) == 768, f"Expected 768 dims, got {len(embedding)}"
 
             # Index
             typesense_client.collections[typesense_test_collection].documents.upsert(
-                document
+                today_document
             )
 
             # Retrieve
             retrieved = typesense_client.collections[typesense_test_collection].documents[
-                document["id"]
+                today_document["id"]
             ].retrieve()
 
             # Verify embedding preserved
@@ -252,32 +222,23 @@ class TestTypesenseE2ESync:
 
     def test_update_document(
         self,
-        postgres_manager: PostgresManager,
         typesense_client,
         typesense_test_collection: str,
-        typesense_test_data: dict,
+        today_document: dict,
     ) -> None:
         """Can update existing document (upsert)."""
-        # Get news from PostgreSQL
-        df = postgres_manager.get_news_for_typesense(
-            typesense_test_data["dates"]["today"]
-        )
-
-        row = df.iloc[0]
-        document = prepare_document(row)
-
         # First insert
-        typesense_client.collections[typesense_test_collection].documents.upsert(document)
+        typesense_client.collections[typesense_test_collection].documents.upsert(today_document)
 
         # Modify document
-        document["title"] = "Updated Title"
+        today_document["title"] = "Updated Title"
 
         # Update (upsert again)
-        typesense_client.collections[typesense_test_collection].documents.upsert(document)
+        typesense_client.collections[typesense_test_collection].documents.upsert(today_document)
 
         # Retrieve
         retrieved = typesense_client.collections[typesense_test_collection].documents[
-            document["id"]
+            today_document["id"]
         ].retrieve()
 
         # Verify update
@@ -295,17 +256,9 @@ class TestTypesenseDocumentPreparation:
     """Tests for prepare_document function."""
 
     def test_prepare_document_required_fields(
-        self, postgres_manager: PostgresManager, typesense_test_data: dict
+        self, today_document: dict
     ) -> None:
         """prepare_document includes all required fields."""
-        # Get news from PostgreSQL
-        df = postgres_manager.get_news_for_typesense(
-            typesense_test_data["dates"]["today"]
-        )
-
-        row = df.iloc[0]
-        document = prepare_document(row)
-
         # Required fields for Typesense
         required_fields = [
             "id",
@@ -316,13 +269,13 @@ class TestTypesenseDocumentPreparation:
         ]
 
         for field in required_fields:
-            assert field in document, f"Missing required field: {field}"
+            assert field in today_document, f"Missing required field: {field}"
 
         # Should have at least one timestamp field
         has_timestamp = (
-            "published_at_ts" in document
-            or "published_at" in document
-            or "extracted_at" in document
+            "published_at_ts" in today_document
+            or "published_at" in today_document
+            or "extracted_at" in today_document
         )
         assert has_timestamp, "Should have at least one timestamp field"
 
@@ -359,18 +312,10 @@ class TestTypesenseDocumentPreparation:
         assert "title" in document
 
     def test_prepare_document_array_fields(
-        self, postgres_manager: PostgresManager, typesense_test_data: dict
+        self, today_document: dict
     ) -> None:
         """prepare_document handles array fields (tags)."""
-        # Get news with tags
-        df = postgres_manager.get_news_for_typesense(
-            typesense_test_data["dates"]["today"]
-        )
-
-        row = df.iloc[0]
-        document = prepare_document(row)
-
         # Today's news has tags
-        if "tags" in document and document["tags"]:
-            assert isinstance(document["tags"], list)
-            assert len(document["tags"]) > 0
+        if "tags" in today_document and today_document["tags"]:
+            assert isinstance(today_document["tags"], list)
+            assert len(today_document["tags"]) > 0
@@ -225,8 +225,7 @@ class TestRollback:
 
         # has_news_features_table returns False (simpler case)
         mock_cursor.fetchone.side_effect = [
-            (0,),    # count of rows with NULL legacy_unique_id
-            (5,),    # count of rows to rollback
+            (0, 5),  # rows with NULL legacy_unique_id, rows to rollback
             (False,),  # has_news_features_table
             (0,),    # verification: count of mismatched rows
         ]
@@ -243,8 +242,7 @@ class TestRollback:
         mock_conn.cursor.return_value = mock_cursor
 
         mock_cursor.fetchone.side_effect = [
-            (0,),       # count of rows with NULL legacy_unique_id
-            (5,),       # count of rows to rollback
+            (0, 5),     # rows with NULL legacy_unique_id, rows to rollback
             (True,),    # has_news_features_table
             ("news_features_unique_id_fkey",),  # FK constraint name
             (0,),       # verification
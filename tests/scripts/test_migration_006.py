@@ -138,8 +138,7 @@ class TestMigrate006:
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_cursor.fetchone.side_effect = [
-            (0,),     # null legacy count
-            (5,),     # rows to rollback
+            (0, 5),   # null legacy count, rows to rollback
             (True,),  # has_news_features_table
             ("news_features_unique_id_fkey",),  # FK name
             (0,),     # verification
@@ -155,8 +154,7 @@ class TestMigrate006:
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_cursor.fetchone.side_effect = [
-            (0,),     # null legacy count
-            (5,),     # rows to rollback
+            (0, 5),   # null legacy count, rows to rollback
         ]
 
         result = mod.rollback(mock_conn, dry_run=True)
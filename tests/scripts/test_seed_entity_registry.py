@@ -291,9 +291,12 @@ class TestAliasCollisions:
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.side_effect = [(2,), (5,)]
+        mock_cursor.fetchone.side_effect = [(2, 5)]
 
         result = mod.rollback(mock_conn, dry_run=True)
         assert isinstance(result, dict)
         assert result.get("preview") is True
+        assert result["aliases_to_delete"] == 2
+        assert result["entities_to_delete"] == 5
+        mock_cursor.execute.assert_called_once()
         mock_conn.commit.assert_not_called()
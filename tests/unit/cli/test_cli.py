@@ -31,6 +31,7 @@ class TestSyncTypesenseCommand:
         mock_sync.assert_called_once()
         call_kwargs = mock_sync.call_args[1]
         assert call_kwargs["start_date"] == "2024-01-01"
+        assert call_kwargs["batch_size"] == 5000
 
     @patch("data_platform.jobs.typesense.sync_to_typesense")
     def test_sync_with_date_range(self, mock_sync):
@@ -44,7 +44,7 @@ class TestBatchUpsertTrending:
             count = batch_upsert_trending("postgresql://test", df)
 
         assert count == 3
-        assert mock_conn.execute.call_count == 3
+        assert mock_conn.execute.call_count == 1
         mock_engine.dispose.assert_called_once()
 
     def test_handles_empty_dataframe(self, mock_sqlalchemy_engine):
@@ -56,6 +56,7 @@ class TestBatchUpsertTrending:
             count = batch_upsert_trending("postgresql://test", df)
 
         assert count == 0
+        mock_conn.execute.assert_not_called()
         mock_engine.dispose.assert_called_once()
 
     def test_upserts_correct_feature_dict(self, mock_sqlalchemy_engine):
@@ -71,10 +72,26 @@ class TestBatchUpsertTrending:
 
         execute_call = mock_conn.execute.call_args
         params = execute_call[0][1]
-        assert params["uid"] == "art-1"
-        features = json.loads(params["features"])
+        assert params["uids"] == ["art-1"]
+        features = json.loads(params["features"][0])
         assert features == {"trending_score": pytest.approx(3.14)}
 
+    def test_duplicate_ids_keep_last_score(self, mock_sqlalchemy_engine):
+        mock_engine, mock_conn = mock_sqlalchemy_engine
+
+        df = pd.DataFrame({
+            "unique_id": ["art-1", "art-2", "art-1"],
+            "trending_score": [1.0, 2.0, 3.0],
+        })
+
+        with patch("sqlalchemy.create_engine", return_value=mock_engine):
+            count = batch_upsert_trending("postgresql://test", df)
+
+        assert count == 2
+        params = mock_conn.execute.call_args[0][1]
+        assert params["uids"] == ["art-1", "art-2"]
+        assert json.loads(params["features"][0]) == {"trending_score": 3.0}
+
     def test_closes_engine_on_error(self, mock_sqlalchemy_engine):
         mock_engine, mock_conn = mock_sqlalchemy_engine
         mock_conn.execute.side_effect = Exception("DB error")
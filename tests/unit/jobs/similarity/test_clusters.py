@@ -73,6 +73,7 @@ class TestBatchUpsertClusters:
             count = batch_upsert_clusters("postgresql://test", clusters)
 
         assert count == 2
+        assert mock_conn.execute.call_count == 1
         mock_engine.dispose.assert_called_once()
 
     def test_upserts_correct_feature_dict(self, mock_sqlalchemy_engine):
@@ -83,17 +84,18 @@ class TestBatchUpsertClusters:
 
         execute_call = mock_conn.execute.call_args
         params = execute_call[0][1]
-        assert params["uid"] == "art-1"
-        features = json.loads(params["features"])
+        assert params["uids"] == ["art-1"]
+        features = json.loads(params["features"][0])
         assert features == {"similar_articles": ["art-2", "art-3"]}
 
     def test_empty_clusters(self, mock_sqlalchemy_engine):
-        mock_engine, _ = mock_sqlalchemy_engine
+        mock_engine, mock_conn = mock_sqlalchemy_engine
 
         with patch("sqlalchemy.create_engine", return_value=mock_engine):
             count = batch_upsert_clusters("postgresql://test", {})
 
         assert count == 0
+        mock_conn.execute.assert_not_called()
         mock_engine.dispose.assert_called_once()
 
     def test_closes_engine_on_error(self, mock_sqlalchemy_engine):
@@ -11,6 +11,7 @@ import pandas as pd
 import pytest
 
 from data_platform.jobs.typesense.sync_job import (
+    TS_IMPORT_TIMEOUT,
     _sync_small_dataset,
     sync_to_typesense,
 )
@@ -100,7 +101,7 @@ class TestSyncToTypesense:
 
         # Verify mocks were called
         mock_postgres_manager.assert_called_once()
-        mock_get_client.assert_called_once()
+        mock_get_client.assert_called_once_with(timeout=TS_IMPORT_TIMEOUT)
         mock_create_collection.assert_called_once_with(mock_client)
         mock_index_documents.assert_called_once()
         mock_pg.close_all.assert_called_once()
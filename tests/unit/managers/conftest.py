@@ -14,7 +14,7 @@ def pg():
     with patch("data_platform.managers.postgres_manager.pool") as mock_pool:
         with patch("data_platform.managers.postgres_manager.create_engine"):
             manager = PostgresManager(connection_string="postgresql://test")
-    manager.pool = mock_pool.SimpleConnectionPool.return_value
+    manager.pool = mock_pool.ThreadedConnectionPool.return_value
     manager._engine = MagicMock()
     return manager
 
@@ -5,9 +5,9 @@ Tests are organized by functional area:
 - Core: init, cache, context manager, connection string
 - Models: Pydantic model validation
 - SQLAlchemy: engine creation and disposal
-- Features: upsert_features, get_features, get_features_batch
+- Features: upsert_features, upsert_features_batch, get_features, get_features_batch
 - Typesense: query building, count/get/iter for typesense sync
-- CRUD: update, get, get_by_unique_id, count
+- CRUD: insert, update, get, get_by_unique_id, count
 """
 
 import os
@@ -16,6 +16,7 @@ from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
+import psycopg2.errors
 import pytest
 from pydantic import ValidationError
 
@@ -118,7 +119,7 @@ class TestPostgresManagerCore:
     @patch("data_platform.managers.postgres_manager.pool")
     def test_context_manager(self, mock_pool: Mock) -> None:
         mock_pool_instance = MagicMock()
-        mock_pool.SimpleConnectionPool.return_value = mock_pool_instance
+        mock_pool.ThreadedConnectionPool.return_value = mock_pool_instance
 
         with PostgresManager(connection_string="postgresql://test") as manager:
             assert manager is not None
@@ -230,7 +231,7 @@ class TestSQLAlchemyEngine:
         mock_engine = MagicMock()
         mock_create_engine.return_value = mock_engine
         mock_pool_instance = MagicMock()
-        mock_pool.SimpleConnectionPool.return_value = mock_pool_instance
+        mock_pool.ThreadedConnectionPool.return_value = mock_pool_instance
 
         manager = PostgresManager(connection_string="postgresql://test")
         manager.close_all()
@@ -296,6 +297,57 @@ class TestUpsertFeatures:
         pg.pool.putconn.assert_called_once_with(mock_conn)
 
 
+class TestUpsertFeaturesBatch:
+    def test_upsert_features_batch_single_statement(self, pg, mock_conn):
+        cursor = MagicMock()
+        mock_conn.cursor.return_value = cursor
+        cursor.rowcount = 2
+
+        with patch("data_platform.managers.postgres_manager.execute_values") as mock_ev:
+            result = pg.upsert_features_batch(
+                {"abc123": {"word_count": 150}, "def456": {"word_count": 200}}
+            )
+
+        assert result == 2
+        mock_ev.assert_called_once()
+        sql, rows = mock_ev.call_args[0][1], mock_ev.call_args[0][2]
+        assert "INSERT INTO news_features" in sql
+        assert "features || EXCLUDED.features" in sql
+        assert [uid for uid, _ in rows] == ["abc123", "def456"]
+        mock_conn.commit.assert_called_once()
+
+    def test_upsert_features_batch_skips_empty(self, pg, mock_conn):
+        cursor = MagicMock()
+        mock_conn.cursor.return_value = cursor
+        cursor.rowcount = 1
+
+        with patch("data_platform.managers.postgres_manager.execute_values") as mock_ev:
+            pg.upsert_features_batch({"abc123": {"word_count": 150}, "def456": {}})
+
+        rows = mock_ev.call_args[0][2]
+        assert [uid for uid, _ in rows] == ["abc123"]
+
+    def test_upsert_features_batch_empty_returns_zero(self, pg, mock_conn):
+        result = pg.upsert_features_batch({})
+
+        assert result == 0
+        mock_conn.cursor.assert_not_called()
+
+    def test_upsert_features_batch_rollback_on_error(self, pg, mock_conn):
+        cursor = MagicMock()
+        mock_conn.cursor.return_value = cursor
+
+        with patch(
+            "data_platform.managers.postgres_manager.execute_values",
+            side_effect=Exception("DB error"),
+        ):
+            with pytest.raises(Exception, match="DB error"):
+                pg.upsert_features_batch({"abc123": {"word_count": 100}})
+
+        mock_conn.rollback.assert_called_once()
+        pg.pool.putconn.assert_called_once_with(mock_conn)
+
+
 class TestGetFeatures:
     def test_get_features_existing(self, pg, mock_conn):
         cursor = MagicMock()
@@ -492,45 +544,222 @@ class TestIterNewsForTypesense:
 
         assert batches == []
 
+    @staticmethod
+    def _mock_named_cursor(pg, pages):
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        mock_cursor.description = [("unique_id",)]
+        mock_cursor.fetchmany.side_effect = [*pages, []]
+        pg.pool.getconn.return_value = mock_conn
+        return mock_conn, mock_cursor
+
     def test_yields_single_batch_for_small_dataset(self, pg):
-        df = pd.DataFrame({"unique_id": [f"id{i}" for i in range(10)]})
+        rows = [(f"id{i}",) for i in range(10)]
+        mock_conn, _ = self._mock_named_cursor(pg, [rows])
 
         with patch.object(pg, "count_news_for_typesense", return_value=10):
-            with patch("pandas.read_sql_query", return_value=df):
-                batches = list(pg.iter_news_for_typesense("2024-01-01", batch_size=1000))
+            batches = list(pg.iter_news_for_typesense("2024-01-01", batch_size=1000))
 
         assert len(batches) == 1
         assert len(batches[0]) == 10
+        assert list(batches[0].columns) == ["unique_id"]
 
     def test_stops_when_empty_batch_returned(self, pg):
+        self._mock_named_cursor(pg, [])
+
         with patch.object(pg, "count_news_for_typesense", return_value=100):
-            with patch("pandas.read_sql_query", return_value=pd.DataFrame()):
-                batches = list(pg.iter_news_for_typesense("2024-01-01", batch_size=1000))
+            batches = list(pg.iter_news_for_typesense("2024-01-01", batch_size=1000))
 
         assert batches == []
 
     def test_yields_multiple_batches(self, pg):
-        batch = pd.DataFrame({"unique_id": [f"id{i}" for i in range(5)]})
-
-        call_count = 0
-
-        def read_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            return batch if call_count <= 2 else pd.DataFrame()
+        page = [(f"id{i}",) for i in range(5)]
+        _, mock_cursor = self._mock_named_cursor(pg, [page, page])
 
         with patch.object(pg, "count_news_for_typesense", return_value=10):
-            with patch("pandas.read_sql_query", side_effect=read_side_effect):
-                batches = list(pg.iter_news_for_typesense("2024-01-01", batch_size=5))
+            batches = list(pg.iter_news_for_typesense("2024-01-01", batch_size=5))
 
         assert len(batches) == 2
+        mock_cursor.fetchmany.assert_called_with(5)
+
+    def test_streams_through_one_named_cursor(self, pg):
+        mock_conn, mock_cursor = self._mock_named_cursor(pg, [[("id0",)]])
+
+        with patch.object(pg, "count_news_for_typesense", return_value=1):
+            list(pg.iter_news_for_typesense("2024-01-01", "2024-01-31", batch_size=500))
+
+        mock_conn.cursor.assert_called_with(name="iter_news_for_typesense")
+        assert mock_cursor.execute.call_count == 2
+        assert mock_cursor.execute.call_args_list[0].args == ("SET TRANSACTION READ ONLY",)
+        assert mock_cursor.execute.call_args[0][1] == ("2024-01-01", "2024-01-31")
+        assert "OFFSET" not in mock_cursor.execute.call_args[0][0]
+        assert mock_cursor.itersize == 500
+
+    def test_releases_connection_when_consumer_stops_early(self, pg):
+        page = [("id0",)]
+        mock_conn, _ = self._mock_named_cursor(pg, [page, page])
+
+        with patch.object(pg, "count_news_for_typesense", return_value=2):
+            batches = pg.iter_news_for_typesense("2024-01-01", batch_size=1)
+            next(batches)
+            batches.close()
+
+        mock_conn.rollback.assert_called_once()
+        pg.pool.putconn.assert_called_once_with(mock_conn)
 
 
 # ---------------------------------------------------------------------------
-# CRUD: update, get, get_by_unique_id, count
+# CRUD: insert, update, get, get_by_unique_id, count
 # ---------------------------------------------------------------------------
 
 
+def _news_insert(i: int) -> NewsInsert:
+    return NewsInsert(
+        unique_id=f"id{i}",
+        agency_id=1,
+        title=f"Notícia {i}",
+        published_at=datetime(2024, 1, 15, 10, 0),
+    )
+
+
+class TestInsert:
+    def test_insert_sends_all_rows_in_one_statement(self, pg, mock_conn):
+        cursor = MagicMock()
+        cursor.rowcount = 250
+        mock_conn.cursor.return_value = cursor
+        news = [_news_insert(i) for i in range(250)]
+
+        with patch("data_platform.managers.postgres_manager.execute_values") as mock_ev:
+            result = pg.insert(news)
+
+        assert result == 250
+        mock_ev.assert_called_once()
+        assert len(mock_ev.call_args[0][2]) == 250
+        assert mock_ev.call_args[1]["page_size"] == 250
+        assert "ON CONFLICT (unique_id) DO NOTHING" in mock_ev.call_args[0][1]
+        mock_conn.commit.assert_called_once()
+
+    def test_insert_allow_update_builds_upsert(self, pg, mock_conn):
+        cursor = MagicMock()
+        cursor.rowcount = 1
+        mock_conn.cursor.return_value = cursor
+
+        with patch("data_platform.managers.postgres_manager.execute_values") as mock_ev:
+            pg.insert([_news_insert(0)], allow_update=True)
+
+        sql = mock_ev.call_args[0][1]
+        assert "DO UPDATE SET" in sql
+        assert "title = EXCLUDED.title" in sql
+        assert "unique_id = EXCLUDED.unique_id" not in sql
+
+    def test_insert_dedupes_unique_id_keeping_last(self, pg, mock_conn):
+        cursor = MagicMock()
+        cursor.rowcount = 2
+        mock_conn.cursor.return_value = cursor
+        updated = _news_insert(0)
+        updated.title = "Notícia atualizada"
+
+        with patch("data_platform.managers.postgres_manager.execute_values") as mock_ev:
+            pg.insert([_news_insert(0), _news_insert(1), updated], allow_update=True)
+
+        values = mock_ev.call_args[0][2]
+        assert len(values) == 2
+        assert "Notícia atualizada" in values[0]
+        assert mock_ev.call_args[1]["page_size"] == 2
+
+    def test_insert_dedupes_unique_id_keeping_first_without_update(self, pg, mock_conn):
+        cursor = MagicMock()
+        cursor.rowcount = 2
+        mock_conn.cursor.return_value = cursor
+        later = _news_insert(0)
+        later.title = "Notícia repetida"
+
+        with patch("data_platform.managers.postgres_manager.execute_values") as mock_ev:
+            pg.insert([_news_insert(0), _news_insert(1), later])
+
+        values = mock_ev.call_args[0][2]
+        assert len(values) == 2
+        assert "Notícia 0" in values[0]
+        assert "Notícia repetida" not in values[0]
+        assert "ON CONFLICT (unique_id) DO NOTHING" in mock_ev.call_args[0][1]
+
+
+class TestBulkInsert:
+    def test_insert_routes_large_batches_to_copy(self, pg, mock_conn):
+        news = [_news_insert(i) for i in range(500)]
+
+        with patch.object(pg, "bulk_insert", return_value=500) as mock_bulk:
+            with patch("data_platform.managers.postgres_manager.execute_values") as mock_ev:
+                result = pg.insert(news, allow_update=True)
+
+        assert result == 500
+        mock_bulk.assert_called_once_with(news, allow_update=True)
+        mock_ev.assert_not_called()
+
+    def test_bulk_insert_copies_into_stage_then_inserts(self, pg, mock_conn):
+        cursor = MagicMock()
+        cursor.rowcount = 2
+        mock_conn.cursor.return_value = cursor
+
+        result = pg.bulk_insert([_news_insert(0), _news_insert(1)])
+
+        assert result == 2
+        copy_sql, buf = cursor.copy_expert.call_args[0]
+        assert copy_sql.startswith("COPY news_stage (unique_id, agency_id,")
+        lines = buf.getvalue().splitlines()
+        assert len(lines) == 2
+        assert lines[0].split("\t")[:3] == ["id0", "1", "\\N"]
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert "CREATE TEMP TABLE news_stage ON COMMIT DROP" in statements[0]
+        assert "SELECT unique_id" in statements[1] and "FROM news_stage" in statements[1]
+        assert "ON CONFLICT (unique_id) DO NOTHING" in statements[1]
+        mock_conn.commit.assert_called_once()
+
+    def test_bulk_insert_dedupes_unique_id_keeping_last(self, pg, mock_conn):
+        cursor = MagicMock()
+        cursor.rowcount = 2
+        mock_conn.cursor.return_value = cursor
+        updated = _news_insert(0)
+        updated.title = "Notícia atualizada"
+
+        pg.bulk_insert([_news_insert(0), _news_insert(1), updated], allow_update=True)
+
+        lines = cursor.copy_expert.call_args[0][1].getvalue().splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("id0\t")
+        assert "Notícia atualizada" in lines[0]
+        assert "DO UPDATE SET" in cursor.execute.call_args_list[1].args[0]
+
+    def test_bulk_insert_dedupes_unique_id_keeping_first_without_update(self, pg, mock_conn):
+        cursor = MagicMock()
+        cursor.rowcount = 2
+        mock_conn.cursor.return_value = cursor
+        later = _news_insert(0)
+        later.title = "Notícia repetida"
+
+        pg.bulk_insert([_news_insert(0), _news_insert(1), later])
+
+        lines = cursor.copy_expert.call_args[0][1].getvalue().splitlines()
+        assert len(lines) == 2
+        assert "Notícia 0" in lines[0]
+        assert "Notícia repetida" not in lines[0]
+
+    def test_bulk_insert_rolls_back_on_error(self, pg, mock_conn):
+        cursor = MagicMock()
+        cursor.copy_expert.side_effect = Exception("COPY failed")
+        mock_conn.cursor.return_value = cursor
+
+        with pytest.raises(Exception, match="COPY failed"):
+            pg.bulk_insert([_news_insert(0)])
+
+        mock_conn.rollback.assert_called_once()
+        pg.pool.putconn.assert_called_once_with(mock_conn)
+
+    def test_bulk_insert_empty_list_raises(self, pg):
+        with pytest.raises(ValueError, match="News list cannot be empty"):
+            pg.bulk_insert([])
+
+
 class TestUpdate:
     def test_update_returns_true_when_found(self, pg):
         mock_conn = MagicMock()
@@ -655,12 +884,10 @@ class TestGetByUniqueId:
     def test_returns_news_when_found(self, pg):
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
-            {
-                "id": 1, "unique_id": "abc123", "agency_id": 1, "title": "Test",
-                "published_at": datetime(2024, 1, 1),
-            }
-        ]
+        mock_cursor.fetchone.return_value = {
+            "id": 1, "unique_id": "abc123", "agency_id": 1, "title": "Test",
+            "published_at": datetime(2024, 1, 1),
+        }
         mock_conn.cursor.return_value = mock_cursor
         pg.pool.getconn.return_value = mock_conn
 
@@ -668,11 +895,15 @@ class TestGetByUniqueId:
 
         assert result is not None
         assert result.unique_id == "abc123"
+        mock_cursor.execute.assert_called_with(
+            "EXECUTE get_news_by_unique_id (%s)", ("abc123",)
+        )
+        pg.pool.putconn.assert_called_once_with(mock_conn)
 
     def test_returns_none_when_not_found(self, pg):
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = None
         mock_conn.cursor.return_value = mock_cursor
         pg.pool.getconn.return_value = mock_conn
 
@@ -680,6 +911,77 @@ class TestGetByUniqueId:
 
         assert result is None
 
+    def test_prepares_once_per_connection(self, pg):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = None
+        mock_conn.cursor.return_value = mock_cursor
+        pg.pool.getconn.return_value = mock_conn
+
+        pg.get_by_unique_id("a")
+        pg.get_by_unique_id("b")
+
+        sqls = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert sum(sql.startswith("PREPARE") for sql in sqls) == 1
+        assert sum(sql.startswith("EXECUTE") for sql in sqls) == 2
+
+    def test_prepares_explicit_column_list(self, pg):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = None
+        mock_conn.cursor.return_value = mock_cursor
+        pg.pool.getconn.return_value = mock_conn
+
+        pg.get_by_unique_id("a")
+
+        prepare_sql = mock_cursor.execute.call_args_list[0].args[0]
+        assert "SELECT *" not in prepare_sql
+        assert "unique_id, agency_id" in prepare_sql
+
+    def test_reprepares_after_schema_change(self, pg):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = None
+        mock_cursor.execute.side_effect = [
+            None,
+            psycopg2.errors.FeatureNotSupported("cached plan must not change result type"),
+            None,
+            None,
+            None,
+        ]
+        mock_conn.cursor.return_value = mock_cursor
+        pg.pool.getconn.return_value = mock_conn
+
+        assert pg.get_by_unique_id("a") is None
+
+        sqls = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert sqls[2] == "DEALLOCATE get_news_by_unique_id"
+        assert sqls[3].startswith("PREPARE")
+        assert sqls[4].startswith("EXECUTE")
+        mock_conn.rollback.assert_called_once()
+        assert mock_conn in pg._prepared_conns
+
+    def test_reprepares_when_statement_is_missing(self, pg):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = None
+        mock_conn.cursor.return_value = mock_cursor
+        pg.pool.getconn.return_value = mock_conn
+        pg.get_by_unique_id("a")
+
+        mock_cursor.execute.reset_mock()
+        mock_cursor.execute.side_effect = [
+            psycopg2.errors.InvalidSqlStatementName("prepared statement does not exist"),
+            None,
+            None,
+        ]
+        pg.get_by_unique_id("b")
+
+        sqls = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert sqls[0].startswith("EXECUTE")
+        assert sqls[1].startswith("PREPARE")
+        assert sqls[2].startswith("EXECUTE")
+
 
 class TestCount:
     def test_count_without_filters(self, pg):
@@ -121,13 +121,19 @@ class TestGetClient:
 class TestWaitForTypesense:
     """Tests for wait_for_typesense() function."""
 
-    @patch("data_platform.typesense.client.requests.get")
+    @staticmethod
+    def _session_get(mock_session_cls):
+        """Return the get() mock of the session opened by wait_for_typesense."""
+        return mock_session_cls.return_value.__enter__.return_value.get
+
+    @patch("data_platform.typesense.client.requests.Session")
     @patch("data_platform.typesense.client.get_client")
-    def test_wait_success_on_first_try(self, mock_get_client, mock_requests_get):
+    def test_wait_success_on_first_try(self, mock_get_client, mock_session_cls):
         """Wait succeeds immediately when Typesense is ready."""
+        mock_get = self._session_get(mock_session_cls)
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_requests_get.return_value = mock_response
+        mock_get.return_value = mock_response
 
         mock_client = Mock()
         mock_get_client.return_value = mock_client
@@ -135,17 +141,18 @@ class TestWaitForTypesense:
         result = wait_for_typesense(api_key="key", max_retries=3)
 
         assert result == mock_client
-        assert mock_requests_get.call_count == 1
+        assert mock_get.call_count == 1
 
-    @patch("data_platform.typesense.client.requests.get")
+    @patch("data_platform.typesense.client.requests.Session")
     @patch("data_platform.typesense.client.get_client")
     @patch("data_platform.typesense.client.time.sleep")
     def test_wait_retries_on_connection_error(
-        self, mock_sleep, mock_get_client, mock_requests_get
+        self, mock_sleep, mock_get_client, mock_session_cls
     ):
         """Wait retries on connection errors."""
+        mock_get = self._session_get(mock_session_cls)
         # First 2 calls fail, third succeeds
-        mock_requests_get.side_effect = [
+        mock_get.side_effect = [
             ConnectionError("Refused"),
             ConnectionError("Refused"),
             Mock(status_code=200),
@@ -157,15 +164,54 @@ class TestWaitForTypesense:
         result = wait_for_typesense(api_key="key", max_retries=3, retry_interval=1)
 
         assert result == mock_client
-        assert mock_requests_get.call_count == 3
+        assert mock_get.call_count == 3
         assert mock_sleep.call_count == 2
 
-    @patch("data_platform.typesense.client.requests.get")
-    def test_wait_returns_none_on_timeout(self, mock_requests_get):
+    @patch("data_platform.typesense.client.requests.Session")
+    def test_wait_returns_none_on_timeout(self, mock_session_cls):
         """Wait returns None after max retries."""
-        mock_requests_get.side_effect = ConnectionError("Refused")
+        mock_get = self._session_get(mock_session_cls)
+        mock_get.side_effect = ConnectionError("Refused")
 
         result = wait_for_typesense(api_key="key", max_retries=2, retry_interval=0)
 
         assert result is None
-        assert mock_requests_get.call_count == 2
+        assert mock_get.call_count == 2
+
+    @patch("data_platform.typesense.client.requests.Session")
+    @patch("data_platform.typesense.client.get_client")
+    @patch("data_platform.typesense.client.time.sleep")
+    def test_wait_reuses_one_session(self, mock_sleep, mock_get_client, mock_session_cls):
+        """All health checks go through a single HTTP session."""
+        mock_get = self._session_get(mock_session_cls)
+        mock_get.side_effect = [ConnectionError("Refused"), Mock(status_code=200)]
+
+        wait_for_typesense(api_key="key", max_retries=3, retry_interval=0)
+
+        mock_session_cls.assert_called_once()
+        assert mock_get.call_count == 2
+
+    @patch("data_platform.typesense.client.requests.Session")
+    @patch("data_platform.typesense.client.time.sleep")
+    def test_wait_backs_off_exponentially_up_to_interval(self, mock_sleep, mock_session_cls):
+        """Delays double from 50ms and are capped at retry_interval."""
+        mock_get = self._session_get(mock_session_cls)
+        mock_get.side_effect = ConnectionError("Refused")
+
+        wait_for_typesense(api_key="key", max_retries=6, retry_interval=0.5)
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [0.05, 0.1, 0.2, 0.4, 0.5]
+
+    @patch("data_platform.typesense.client.requests.Session")
+    @patch("data_platform.typesense.client.time.sleep")
+    def test_wait_counts_non_200_as_failed_attempt(self, mock_sleep, mock_session_cls):
+        """A non-200 health response uses up an attempt instead of spinning."""
+        mock_get = self._session_get(mock_session_cls)
+        mock_get.return_value = Mock(status_code=503)
+
+        result = wait_for_typesense(api_key="key", max_retries=3, retry_interval=1)
+
+        assert result is None
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
@@ -6,7 +6,7 @@ These functions have no side effects and require no mocking.
 
 import json
 import struct
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import numpy as np
 import pandas as pd
@@ -460,18 +460,51 @@ class TestPrepareDocument:
             assert field not in doc
 
 
+class _FakeDocuments:
+    """Minimal stand-in for collection.documents; records import_ calls."""
+
+    def __init__(self, import_results):
+        self.import_results = import_results or []
+        self.import_calls = []
+
+    def import_(self, documents, options):
+        self.import_calls.append((list(documents), options))
+        return self.import_results
+
+
+class _FakeCollection:
+    """Minimal stand-in for client.collections[name]."""
+
+    def __init__(self, num_documents, import_results):
+        self.num_documents = num_documents
+        self.documents = _FakeDocuments(import_results)
+
+    def retrieve(self):
+        return {"num_documents": self.num_documents, "fields": []}
+
+
+class _FakeCollections:
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getitem__(self, name):
+        return self._collection
+
+
+class _FakeTypesenseClient:
+    """Plain-object Typesense client exposing only what index_documents() uses."""
+
+    def __init__(self, collection):
+        self.collections = _FakeCollections(collection)
+
+
 class TestIndexDocuments:
     """Tests for index_documents() function."""
 
     def _make_client(self, num_documents=0, import_results=None):
-        """Build a MagicMock typesense client (supports collections[name] subscript)."""
-        mock_collection = MagicMock()
-        mock_collection.retrieve.return_value = {"num_documents": num_documents, "fields": []}
-        if import_results is not None:
-            mock_collection.documents.import_.return_value = import_results
-        mock_client = MagicMock()
-        mock_client.collections.__getitem__.return_value = mock_collection
-        return mock_client, mock_collection
+        """Build a fake typesense client (supports collections[name] subscript)."""
+        collection = _FakeCollection(num_documents, import_results)
+        return _FakeTypesenseClient(collection), collection
 
     def test_index_small_batch(self):
         """Index small batch of documents."""
@@ -504,7 +537,7 @@ class TestIndexDocuments:
         stats = index_documents(mock_client, df, mode="full", force=False)
 
         assert stats["skipped"] is True
-        mock_collection.documents.import_.assert_not_called()
+        assert mock_collection.documents.import_calls == []
 
     def test_index_full_mode_proceeds_with_force(self):
         """Full mode with force proceeds even if collection non-empty."""
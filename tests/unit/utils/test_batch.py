@@ -8,9 +8,13 @@ These tests ensure that:
 4. Statistics are calculated correctly
 """
 
+import numpy as np
 import pytest
 import pandas as pd
 
+# Shared id buffer; fetch stubs return slices of it instead of fresh ranges
+_IDS = np.arange(1000)
+
 
 class TestBatchIterator:
     """Tests for batch_iterator function."""
@@ -22,7 +26,7 @@ class TestBatchIterator:
         results = []
 
         def fetch(offset, limit):
-            return pd.DataFrame({"id": range(offset, min(offset + limit, 10))})
+            return pd.DataFrame({"id": _IDS[offset : min(offset + limit, 10)]}, copy=False)
 
         for batch in batch_iterator(total_count=10, batch_size=20, fetch_fn=fetch):
             results.append(batch)
@@ -40,7 +44,7 @@ class TestBatchIterator:
             end = min(offset + limit, 100)
             if offset >= 100:
                 return pd.DataFrame()
-            return pd.DataFrame({"id": range(offset, end)})
+            return pd.DataFrame({"id": _IDS[offset:end]}, copy=False)
 
         for batch in batch_iterator(total_count=100, batch_size=30, fetch_fn=fetch):
             results.append(batch)
@@ -156,6 +160,90 @@ class TestProcessInBatches:
         assert stats["batches_success"] == 1
         assert stats["batches_total"] == 2  # Stopped after second batch
 
+    def test_with_errors_stop_enum(self):
+        """OnError.STOP behaves like on_error='stop'."""
+        from data_platform.utils.batch import OnError, process_in_batches
+
+        def process(batch):
+            raise Exception("Simulated error")
+
+        stats = process_in_batches(
+            items=list(range(100)), batch_size=30, process_fn=process, on_error=OnError.STOP
+        )
+
+        assert stats["batches_total"] == 1
+
+    def test_unknown_on_error_continues(self):
+        """Unrecognized strategies fall back to continuing."""
+        from data_platform.utils.batch import process_in_batches
+
+        def process(batch):
+            raise Exception("Simulated error")
+
+        stats = process_in_batches(
+            items=list(range(100)), batch_size=30, process_fn=process, on_error="retry"
+        )
+
+        assert stats["batches_total"] == 4
+        assert stats["batches_failed"] == 4
+
+    def test_concurrent_batches_overlap(self):
+        """With max_workers, batches run at the same time."""
+        import threading
+
+        from data_platform.utils.batch import process_in_batches
+
+        # Every batch waits for all four to arrive: deadlocks (times out) if serial
+        barrier = threading.Barrier(4, timeout=5)
+
+        stats = process_in_batches(
+            items=list(range(40)),
+            batch_size=10,
+            process_fn=lambda batch: barrier.wait(),
+            max_workers=4,
+        )
+
+        assert stats["processed"] == 40
+        assert stats["batches_success"] == 4
+        assert stats["batches_failed"] == 0
+
+    def test_concurrent_errors_continue(self):
+        """Failed batches are counted the same way with threads."""
+        from data_platform.utils.batch import process_in_batches
+
+        def process(batch):
+            if 30 in batch:
+                raise ValueError("boom")
+
+        stats = process_in_batches(
+            items=list(range(100)), batch_size=30, process_fn=process, max_workers=3
+        )
+
+        assert stats["processed"] == 70
+        assert stats["errors"] == 30
+        assert stats["batches_total"] == 4
+        assert stats["batches_failed"] == 1
+
+    def test_concurrent_errors_stop_accounts_started_batches(self):
+        """With 'stop', every batch that ran is accounted for exactly once."""
+        from data_platform.utils.batch import process_in_batches
+
+        def process(batch):
+            if 0 in batch:
+                raise ValueError("boom")
+
+        stats = process_in_batches(
+            items=list(range(100)),
+            batch_size=10,
+            process_fn=process,
+            on_error="stop",
+            max_workers=2,
+        )
+
+        assert stats["batches_failed"] == 1
+        assert stats["batches_total"] == stats["batches_success"] + stats["batches_failed"]
+        assert stats["processed"] + stats["errors"] == 10 * stats["batches_total"]
+
     def test_empty_list(self):
         """Empty list returns zero stats."""
         from data_platform.utils.batch import process_in_batches
@@ -237,6 +325,22 @@ class TestChunked:
 
         assert result == [[1], [2], [3]]
 
+    def test_consumes_generator_lazily(self):
+        """Only the items needed for the current chunk are pulled."""
+        from data_platform.utils.batch import chunked
+
+        pulled = []
+
+        def source():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        first = next(chunked(source(), 3))
+
+        assert first == [0, 1, 2]
+        assert pulled == [0, 1, 2]
+
 
 class TestCalculateBatchStats:
     """Tests for calculate_batch_stats function."""
@@ -273,6 +377,15 @@ class TestCalculateBatchStats:
         assert stats["num_batches"] == 0
         assert stats["last_batch_size"] == 0
 
+    def test_zero_total_and_batch_size(self):
+        """Empty input does not divide by the batch size."""
+        from data_platform.utils.batch import calculate_batch_stats
+
+        stats = calculate_batch_stats(total=0, batch_size=0)
+
+        assert stats["num_batches"] == 0
+        assert stats["last_batch_size"] == 0
+
     def test_single_batch(self):
         """Stats when everything fits in one batch."""
         from data_platform.utils.batch import calculate_batch_stats
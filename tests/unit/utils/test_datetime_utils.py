@@ -8,32 +8,38 @@ These tests ensure that:
 4. Edge cases are handled properly
 """
 
-from datetime import datetime, date, timezone
+from datetime import datetime, date, timedelta, timezone
 
+import numpy as np
 import pytest
 
+from data_platform.utils.datetime_utils import (
+    _week_for_day,
+    calculate_published_week,
+    calculate_published_weeks,
+    format_date_range,
+    get_current_timestamp,
+    get_today_str,
+    parse_date,
+    to_timestamp,
+)
+
 
 class TestParseDate:
     """Tests for parse_date function."""
 
     def test_parse_none(self):
         """None returns None."""
-        from data_platform.utils.datetime_utils import parse_date
-
         assert parse_date(None) is None
 
     def test_parse_datetime(self):
         """datetime returns as-is."""
-        from data_platform.utils.datetime_utils import parse_date
-
         dt = datetime(2025, 1, 15, 10, 30)
         result = parse_date(dt)
         assert result == dt
 
     def test_parse_date_object(self):
         """date converts to datetime at midnight."""
-        from data_platform.utils.datetime_utils import parse_date
-
         d = date(2025, 1, 15)
         result = parse_date(d)
         assert result is not None
@@ -45,8 +51,6 @@ class TestParseDate:
 
     def test_parse_timestamp_int(self):
         """int interprets as Unix timestamp."""
-        from data_platform.utils.datetime_utils import parse_date
-
         # 2025-01-15 00:00:00 UTC
         ts = 1736899200
         result = parse_date(ts)
@@ -56,8 +60,6 @@ class TestParseDate:
 
     def test_parse_timestamp_float(self):
         """float interprets as Unix timestamp."""
-        from data_platform.utils.datetime_utils import parse_date
-
         ts = 1736899200.5
         result = parse_date(ts)
         assert result is not None
@@ -65,15 +67,11 @@ class TestParseDate:
 
     def test_parse_negative_timestamp(self):
         """Negative timestamp returns None."""
-        from data_platform.utils.datetime_utils import parse_date
-
         assert parse_date(-1) is None
         assert parse_date(0) is None
 
     def test_parse_string_iso_date(self):
         """ISO date string parses correctly."""
-        from data_platform.utils.datetime_utils import parse_date
-
         result = parse_date("2025-01-15")
         assert result is not None
         assert result.year == 2025
@@ -82,8 +80,6 @@ class TestParseDate:
 
     def test_parse_string_iso_datetime(self):
         """ISO datetime string parses correctly."""
-        from data_platform.utils.datetime_utils import parse_date
-
         result = parse_date("2025-01-15T10:30:00")
         assert result is not None
         assert result.hour == 10
@@ -91,23 +87,28 @@ class TestParseDate:
 
     def test_parse_string_with_timezone(self):
         """Datetime with timezone parses correctly."""
-        from data_platform.utils.datetime_utils import parse_date
-
         result = parse_date("2025-01-15T10:30:00+00:00")
         assert result is not None
         assert result.year == 2025
 
+    def test_parse_string_zulu_suffix(self):
+        """Trailing 'Z' parses as UTC."""
+        assert parse_date("2025-01-15T10:30:00Z") == datetime(
+            2025, 1, 15, 10, 30, tzinfo=timezone.utc
+        )
+
+    def test_parse_string_non_iso_fallback(self):
+        """Non-ISO strings still parse through the flexible fallback."""
+        assert parse_date("2025/01/15") == datetime(2025, 1, 15)
+        assert parse_date(" 2025-01-15 ") == datetime(2025, 1, 15)
+
     def test_parse_empty_string(self):
         """Empty string returns None."""
-        from data_platform.utils.datetime_utils import parse_date
-
         assert parse_date("") is None
         assert parse_date("   ") is None
 
     def test_parse_invalid_string(self):
         """Invalid string returns None."""
-        from data_platform.utils.datetime_utils import parse_date
-
         assert parse_date("not-a-date") is None
         assert parse_date("abc123") is None
 
@@ -117,14 +118,10 @@ class TestToTimestamp:
 
     def test_none_returns_none(self):
         """None returns None."""
-        from data_platform.utils.datetime_utils import to_timestamp
-
         assert to_timestamp(None) is None
 
     def test_datetime_to_timestamp(self):
         """datetime converts to timestamp."""
-        from data_platform.utils.datetime_utils import to_timestamp
-
         dt = datetime(2025, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
         ts = to_timestamp(dt)
         assert ts is not None
@@ -133,8 +130,6 @@ class TestToTimestamp:
 
     def test_date_to_timestamp(self):
         """date converts to timestamp at midnight."""
-        from data_platform.utils.datetime_utils import to_timestamp
-
         d = date(2025, 1, 15)
         ts = to_timestamp(d)
         assert ts is not None
@@ -143,8 +138,6 @@ class TestToTimestamp:
 
     def test_roundtrip(self):
         """Timestamp roundtrip works."""
-        from data_platform.utils.datetime_utils import parse_date, to_timestamp
-
         original_ts = 1736899200
         dt = parse_date(original_ts)
         result_ts = to_timestamp(dt)
@@ -156,26 +149,18 @@ class TestCalculatePublishedWeek:
 
     def test_none_returns_none(self):
         """None returns None."""
-        from data_platform.utils.datetime_utils import calculate_published_week
-
         assert calculate_published_week(None) is None
 
     def test_zero_returns_none(self):
         """Zero timestamp returns None."""
-        from data_platform.utils.datetime_utils import calculate_published_week
-
         assert calculate_published_week(0) is None
 
     def test_negative_returns_none(self):
         """Negative timestamp returns None."""
-        from data_platform.utils.datetime_utils import calculate_published_week
-
         assert calculate_published_week(-1) is None
 
     def test_week_format_yyyyww(self):
         """Returns YYYYWW format."""
-        from data_platform.utils.datetime_utils import calculate_published_week
-
         # 2025-01-15 is week 3 of 2025
         ts = 1736899200
         week_id = calculate_published_week(ts)
@@ -184,8 +169,6 @@ class TestCalculatePublishedWeek:
 
     def test_first_week_2024(self):
         """First week of 2024."""
-        from data_platform.utils.datetime_utils import calculate_published_week
-
         # 2024-01-01 (Monday)
         ts = 1704067200
         week_id = calculate_published_week(ts)
@@ -194,8 +177,6 @@ class TestCalculatePublishedWeek:
 
     def test_week_year_boundary(self):
         """Week at year boundary."""
-        from data_platform.utils.datetime_utils import calculate_published_week
-
         # 2024-12-31 might be week 1 of 2025 in ISO week
         ts = 1735603200  # 2024-12-31
         week_id = calculate_published_week(ts)
@@ -205,13 +186,53 @@ class TestCalculatePublishedWeek:
 
     def test_float_timestamp(self):
         """Float timestamp works."""
-        from data_platform.utils.datetime_utils import calculate_published_week
-
         ts = 1736899200.5
         week_id = calculate_published_week(ts)
         assert week_id is not None
         assert week_id == 202503
 
+    def test_out_of_range_returns_none(self):
+        """Timestamps past year 9999 have no week ID."""
+        assert calculate_published_week(253402300799) == 999952
+        assert calculate_published_week(1e20) is None
+
+    def test_matches_isocalendar_across_years(self):
+        """Integer week arithmetic agrees with date.isocalendar() for every day 1970-2100."""
+        epoch = date(1970, 1, 1)
+        for day in range((date(2100, 12, 31) - epoch).days + 1):
+            iso_year, iso_week, _ = (epoch + timedelta(days=day)).isocalendar()
+            assert _week_for_day.__wrapped__(day) == iso_year * 100 + iso_week
+
+    def test_same_day_reuses_cached_week(self):
+        """Timestamps on the same UTC day share one cached week computation."""
+        _week_for_day.cache_clear()
+        # 2025-01-15 00:00, 12:00 and 23:59:59 UTC
+        weeks = {calculate_published_week(ts) for ts in (1736899200, 1736942400, 1736985599)}
+
+        assert weeks == {202503}
+        assert _week_for_day.cache_info().misses == 1
+
+
+class TestVectorizedDatetime:
+    """Tests for the array versions of the datetime helpers."""
+
+    def test_published_weeks_match_scalar(self):
+        """calculate_published_weeks agrees with calculate_published_week on 10k timestamps."""
+        rng = np.random.default_rng(0)
+        timestamps = np.concatenate(
+            [rng.integers(1, 4_000_000_000, 10_000), [0, -1]]
+        ).astype("float64")
+        timestamps = np.append(timestamps, np.nan)
+
+        weeks = calculate_published_weeks(timestamps)
+
+        expected = [calculate_published_week(ts) for ts in timestamps]
+        assert [None if np.isnan(w) else int(w) for w in weeks] == expected
+
+    def test_published_weeks_year_boundary(self):
+        """2024-12-31 falls in ISO week 1 of 2025."""
+        assert calculate_published_weeks([1735603200]).tolist() == [202501]
+
 
 class TestBackwardsCompatibility:
     """Tests to ensure backwards compatibility with existing code."""
@@ -256,16 +277,12 @@ class TestFormatDateRange:
 
     def test_single_date(self):
         """Single date uses same for start and end."""
-        from data_platform.utils.datetime_utils import format_date_range
-
         start, end = format_date_range("2025-01-15")
         assert start == "2025-01-15"
         assert end == "2025-01-15"
 
     def test_date_range(self):
         """Date range returns both dates."""
-        from data_platform.utils.datetime_utils import format_date_range
-
         start, end = format_date_range("2025-01-01", "2025-01-15")
         assert start == "2025-01-01"
         assert end == "2025-01-15"
@@ -276,8 +293,6 @@ class TestHelperFunctions:
 
     def test_get_current_timestamp(self):
         """get_current_timestamp returns reasonable value."""
-        from data_platform.utils.datetime_utils import get_current_timestamp
-
         ts = get_current_timestamp()
         assert isinstance(ts, int)
         # Should be after 2024
@@ -285,8 +300,6 @@ class TestHelperFunctions:
 
     def test_get_today_str(self):
         """get_today_str returns valid date string."""
-        from data_platform.utils.datetime_utils import get_today_str
-
         today = get_today_str()
         assert isinstance(today, str)
         # Should match YYYY-MM-DD format
@@ -0,0 +1,42 @@
+"""
+Tests for PostgreSQL COPY helpers.
+
+These tests ensure that:
+1. NULL, arrays and special characters render in COPY text format
+2. Literal backslash sequences in the data are never read as NULL
+"""
+
+from data_platform.utils.pg_copy import copy_text_field, copy_text_row
+
+
+class TestCopyTextField:
+    """Tests for copy_text_field function."""
+
+    def test_none_is_null_marker(self):
+        """None renders as the \\N NULL marker."""
+        assert copy_text_field(None) == "\\N"
+
+    def test_escapes_special_characters(self):
+        """Tabs, newlines and backslashes are escaped."""
+        assert copy_text_field("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+    def test_literal_null_marker_is_escaped(self):
+        """A literal \\N string stays distinct from NULL."""
+        assert copy_text_field("\\N") == "\\\\N"
+
+    def test_lists_render_as_arrays(self):
+        """Lists become quoted array literals."""
+        assert copy_text_field(["x,y", 'q"t']) == '{"x,y","q\\\\"t"}'
+        assert copy_text_field([]) == "{}"
+
+    def test_non_strings_use_str(self):
+        """Numbers render through str()."""
+        assert copy_text_field(3) == "3"
+
+
+class TestCopyTextRow:
+    """Tests for copy_text_row function."""
+
+    def test_tab_separated_line(self):
+        """Fields are tab-joined and the line ends with a newline."""
+        assert copy_text_row(("mec", None, 3)) == "mec\t\\N\t3\n"
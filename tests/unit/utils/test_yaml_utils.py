@@ -0,0 +1,35 @@
+"""
+Tests for YAML utilities.
+
+These tests ensure that:
+1. load_yaml parses text and file streams
+2. Unsafe tags are rejected, as with yaml.safe_load
+"""
+
+import pytest
+import yaml
+
+from data_platform.utils.yaml_utils import load_yaml
+
+
+class TestLoadYaml:
+    """Tests for load_yaml function."""
+
+    def test_parses_text(self):
+        """Plain YAML text parses to Python structures."""
+        assert load_yaml("sources:\n  mec:\n    name: MEC\n") == {
+            "sources": {"mec": {"name": "MEC"}}
+        }
+
+    def test_parses_file(self, tmp_path):
+        """Open text files are accepted."""
+        path = tmp_path / "themes.yaml"
+        path.write_text("themes:\n  - code: '01'\n    label: Educação\n", encoding="utf-8")
+
+        with open(path, encoding="utf-8") as f:
+            assert load_yaml(f) == {"themes": [{"code": "01", "label": "Educação"}]}
+
+    def test_rejects_python_tags(self):
+        """Arbitrary Python objects are not constructed."""
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("!!python/object/apply:os.system ['true']")